@@ -4,31 +4,91 @@ Secure Authentication Module — No SQL, No Injection Risk.
 Credentials are stored as bcrypt-hashed values in a JSON file.
 Users can change their credentials through the Settings page.
 All password comparisons use bcrypt's constant-time comparison.
+
+The bcrypt cost factor defaults to 10 and can be raised with the
+BCRYPT_COST environment variable. Existing hashes keep the cost they
+were created with, so changing it only affects newly set passwords.
 """
 
 import os
+import copy
 import json
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
+import orjson
 
 # Credentials file path (next to this script)
 CREDENTIALS_FILE = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), "credentials.json"
 )
 
+# bcrypt work factor for new hashes (2^cost rounds)
+BCRYPT_COST = int(os.environ.get("BCRYPT_COST", "10"))
+
+# bcrypt releases the GIL while hashing, so a thread pool runs checks in parallel
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Parsed credentials, reused until the file's mtime changes. Shared by every
+# thread, so it is never edited in place: changes go through _edit_credentials.
+_CREDS_CACHE = {"mtime": None, "data": None}
+
+# Serialises load-modify-save, so concurrent changes don't overwrite each other
+_CREDS_WRITE_LOCK = threading.Lock()
+
 
 def _hash_password(plain: str) -> str:
     """Hash a plaintext password using bcrypt."""
-    return bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(
+        plain.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_COST)
+    ).decode("utf-8")
+
+
+# Throwaway hashes verified against for unknown usernames, one per cost
+_DUMMY_HASHES = {}
+
 
+def _dummy_hash(creds: dict) -> bytes:
+    """Dummy hash at the highest cost among the stored hashes.
 
-def _verify_password(plain: str, hashed: str) -> bool:
+    An unknown username then costs as much as the slowest real login, so
+    response times don't reveal which usernames exist.
+    """
+    costs = []
+    for user in creds.values():
+        try:
+            costs.append(int(user["password_hash"].split("$")[2]))
+        except (IndexError, ValueError):
+            pass
+    cost = max(costs, default=BCRYPT_COST)
+    hashed = _DUMMY_HASHES.get(cost)
+    if hashed is None:
+        hashed = bcrypt.hashpw(
+            b"dummy_password_placeholder_for_timing", bcrypt.gensalt(rounds=cost)
+        )
+        _DUMMY_HASHES[cost] = hashed
+    return hashed
+
+
+def _verify_password(plain: str, hashed: str | bytes) -> bool:
     """Verify a plaintext password against a bcrypt hash (constant-time)."""
     try:
-        return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
+        if isinstance(hashed, str):
+            hashed = hashed.encode("utf-8")
+        return bcrypt.checkpw(plain.encode("utf-8"), hashed)
     except Exception:
         return False
 
 
+def _add_hash_bytes(creds: dict) -> dict:
+    """Attach each user's hash pre-encoded for bcrypt (memory only, never saved)."""
+    for user in creds.values():
+        user["password_hash_bytes"] = user["password_hash"].encode("ascii")
+    return creds
+
+
 def _load_credentials() -> dict:
     """Load credentials from the JSON file. Creates default if not exists."""
     if not os.path.exists(CREDENTIALS_FILE):
@@ -42,14 +102,45 @@ def _load_credentials() -> dict:
         _save_credentials(default)
         return default
 
-    with open(CREDENTIALS_FILE, "r") as f:
-        return json.load(f)
+    mtime = os.stat(CREDENTIALS_FILE).st_mtime_ns
+    if mtime == _CREDS_CACHE["mtime"]:
+        return _CREDS_CACHE["data"]
+
+    with open(CREDENTIALS_FILE, "rb") as f:
+        data = _add_hash_bytes(orjson.loads(f.read()))
+    _dummy_hash(data)  # warm it, so the first unknown login isn't slower
+    _CREDS_CACHE["mtime"] = mtime
+    _CREDS_CACHE["data"] = data
+    return data
 
 
 def _save_credentials(creds: dict):
-    """Save credentials to the JSON file."""
+    """Save credentials to the JSON file and refresh the in-memory cache."""
+    on_disk = {
+        name: {k: v for k, v in user.items() if k != "password_hash_bytes"}
+        for name, user in creds.items()
+    }
     with open(CREDENTIALS_FILE, "w") as f:
-        json.dump(creds, f, indent=2)
+        json.dump(on_disk, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    _CREDS_CACHE["mtime"] = os.stat(CREDENTIALS_FILE).st_mtime_ns
+    _CREDS_CACHE["data"] = _add_hash_bytes(creds)
+
+
+def _edit_credentials(edit) -> tuple[bool, str]:
+    """Apply edit to a private copy of the credentials and save it.
+
+    edit(creds) returns (success, message) and may change creds; they are
+    saved only on success. The cached dict is replaced, never mutated, so
+    readers on other threads and a failed save both leave it intact.
+    """
+    with _CREDS_WRITE_LOCK:
+        creds = copy.deepcopy(_load_credentials())
+        success, message = edit(creds)
+        if success:
+            _save_credentials(creds)
+        return success, message
 
 
 def authenticate_user(username: str, password: str) -> bool:
@@ -67,10 +158,10 @@ def authenticate_user(username: str, password: str) -> bool:
     user = creds.get(username)
     if not user:
         # Still run bcrypt to prevent timing attacks revealing valid usernames
-        _verify_password(password, _hash_password("dummy"))
+        _verify_password(password, _dummy_hash(creds))
         return False
 
-    return _verify_password(password, user["password_hash"])
+    return _verify_password(password, user["password_hash_bytes"])
 
 
 def get_display_name(username: str) -> str:
@@ -93,17 +184,18 @@ def change_password(
     if len(new_password) < 6:
         return False, "New password must be at least 6 characters."
 
-    creds = _load_credentials()
-    user = creds.get(username)
-    if not user:
-        return False, "User not found."
+    def edit(creds):
+        user = creds.get(username)
+        if not user:
+            return False, "User not found."
+
+        if not _verify_password(current_password, user["password_hash_bytes"]):
+            return False, "Current password is incorrect."
 
-    if not _verify_password(current_password, user["password_hash"]):
-        return False, "Current password is incorrect."
+        user["password_hash"] = _hash_password(new_password)
+        return True, "Password changed successfully."
 
-    user["password_hash"] = _hash_password(new_password)
-    _save_credentials(creds)
-    return True, "Password changed successfully."
+    return _edit_credentials(edit)
 
 
 def change_username(
@@ -119,18 +211,47 @@ def change_username(
     if len(new_username) < 3:
         return False, "Username must be at least 3 characters."
 
-    creds = _load_credentials()
-    user = creds.get(current_username)
-    if not user:
-        return False, "User not found."
+    def edit(creds):
+        user = creds.get(current_username)
+        if not user:
+            return False, "User not found."
+
+        if not _verify_password(password, user["password_hash_bytes"]):
+            return False, "Password is incorrect."
+
+        if new_username in creds and new_username != current_username:
+            return False, "Username already exists."
+
+        # Remove old username entry, add new one
+        creds[new_username] = creds.pop(current_username)
+        return True, "Username changed successfully."
+
+    return _edit_credentials(edit)
 
-    if not _verify_password(password, user["password_hash"]):
-        return False, "Password is incorrect."
 
-    if new_username in creds and new_username != current_username:
-        return False, "Username already exists."
+async def _run_in_bcrypt_pool(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, func, *args)
 
-    # Remove old username entry, add new one
-    creds[new_username] = creds.pop(current_username)
-    _save_credentials(creds)
-    return True, "Username changed successfully."
+
+async def authenticate_user_async(username: str, password: str) -> bool:
+    """authenticate_user, run on the bcrypt pool instead of the event loop."""
+    return await _run_in_bcrypt_pool(authenticate_user, username, password)
+
+
+async def change_password_async(
+    username: str, current_password: str, new_password: str
+) -> tuple[bool, str]:
+    """change_password, run on the bcrypt pool instead of the event loop."""
+    return await _run_in_bcrypt_pool(
+        change_password, username, current_password, new_password
+    )
+
+
+async def change_username_async(
+    current_username: str, new_username: str, password: str
+) -> tuple[bool, str]:
+    """change_username, run on the bcrypt pool instead of the event loop."""
+    return await _run_in_bcrypt_pool(
+        change_username, current_username, new_username, password
+    )
@@ -1,4 +1,11 @@
-import glob, json, re, os
+import glob, re, os
+
+import orjson
+
+# One pass over the markdown collects every "## Heading ... ---" section; a
+# body stops at the next heading, so an unterminated section stays missing
+_SECTION_RE = re.compile(r'^## ([^\n]+)\n((?:(?!^## ).)*?)\n---', re.DOTALL | re.MULTILINE)
+_H5_RE = re.compile(r'^#####\s+(.*)', re.MULTILINE)
 
 md_files = sorted(glob.glob("analysis_documents/*_analysis.md"))
 
@@ -13,27 +20,30 @@ for md_path in md_files:
     with open(md_path, 'r', encoding='utf-8') as f:
         md_content = f.read()
         
-    with open(json_path, 'r', encoding='utf-8') as f:
+    with open(json_path, 'rb') as f:
         try:
-            json_data = json.load(f)
+            json_data = orjson.loads(f.read())
         except:
             issues.append(f"{os.path.basename(json_path)}: Invalid JSON")
             continue
             
     sections_json = json_data.get('sections', {})
+    md_sections = {}
+    for heading, body in _SECTION_RE.findall(md_content):
+        md_sections.setdefault(heading, body)  # first occurrence wins
     
     # 1. Check Metadata
-    md_meta_match = re.search(r'## Metadata Extraction\n(.*?)\n---', md_content, re.DOTALL)
-    if md_meta_match:
-        md_meta = md_meta_match.group(1).strip()
+    md_meta = md_sections.get('Metadata Extraction')
+    if md_meta is not None:
+        md_meta = md_meta.strip()
         json_meta = sections_json.get('Metadata Extraction', {}).get('content', '').strip()
         if md_meta and not json_meta:
             issues.append(f"{os.path.basename(md_path)}: Metadata missing in JSON but present in MD")
             
     # 2. Check Witnesses
-    md_wit_match = re.search(r'## Principal Witnesses & Ex\.PW Extraction\n(.*?)\n---', md_content, re.DOTALL)
-    if md_wit_match:
-        md_wit = md_wit_match.group(1).strip()
+    md_wit = md_sections.get('Principal Witnesses & Ex.PW Extraction')
+    if md_wit is not None:
+        md_wit = md_wit.strip()
         json_wit = sections_json.get('Principal Witnesses & Ex.PW Extraction', {}).get('content', '').strip()
         if md_wit and not json_wit:
             issues.append(f"{os.path.basename(md_path)}: Witnesses missing in JSON but present in MD")
@@ -41,7 +51,7 @@ for md_path in md_files:
     # 3. Check Audit Headings (for heading format mismatches)
     json_audit = sections_json.get('Investigation Quality Audit', {}).get('content', '')
     if json_audit:
-        h5_headings = re.findall(r'^#####\s+(.*)', json_audit, re.MULTILINE)
+        h5_headings = _H5_RE.findall(json_audit)
         if h5_headings:
             issues.append(f"{os.path.basename(json_path)}: Uses ##### headings in Audit, which UI doesn't parse.")
 
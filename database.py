@@ -1,20 +1,155 @@
 import sqlite3
-import json
 import os
-from datetime import datetime
+import re
+import threading
+import time
+from datetime import date, datetime
+
+import orjson
 
 DB_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cases.db")
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 
-
-def get_db_connection():
-    conn = sqlite3.connect(DB_NAME)
+# parse_date patterns, compiled once
+_ORD_COMBINED = re.compile(r"(\d+)(?:st|nd|rd|th)\b", re.IGNORECASE)
+_YEAR_RE = re.compile(r"\b(20\d{2})\b")
+_DAY_RE = re.compile(r"\b([1-9]|[12]\d|3[01])\b")
+_MONTH_RE = re.compile(
+    r"\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?"
+    r"|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b"
+)
+_MONTH_TO_NUM = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+# Latest plausible judgment year, refreshed at most once an hour
+_MAX_YEAR = {"value": None, "checked": None}
+
+
+def _max_year():
+    now = time.monotonic()
+    if _MAX_YEAR["checked"] is None or now - _MAX_YEAR["checked"] > 3600:
+        _MAX_YEAR["value"] = datetime.now().year + 1
+        _MAX_YEAR["checked"] = now
+    return _MAX_YEAR["value"]
+
+
+def get_db_connection(bulk=False, check_same_thread=True, cached_statements=128):
+    conn = sqlite3.connect(
+        DB_NAME,
+        check_same_thread=check_same_thread,
+        cached_statements=cached_statements,
+    )
     conn.row_factory = sqlite3.Row
+    # Per-connection settings; NORMAL sync is durable enough under WAL,
+    # which init_db() switches on for good
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    if bulk:
+        # WAL (in case init_db() hasn't run yet) + bigger page cache for
+        # write-heavy loads
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA cache_size=-64000")
+    return conn
+
+
+# Read connections kept open per thread, so the page cache stays warm
+# between requests instead of being rebuilt by every connect()
+_TLS = threading.local()
+
+
+def get_read_connection():
+    """Return this thread's long-lived connection for read-only queries.
+
+    Callers must not close it. Its statement cache is sized for every
+    filter combination of get_paginated_records (64 WHERE variants, each
+    with a count and up to four page queries) plus the dashboard queries,
+    so repeat requests skip SQL compilation.
+    """
+    conn = getattr(_TLS, "conn", None)
+    if conn is None:
+        conn = get_db_connection(cached_statements=512)
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        _TLS.conn = conn
     return conn
 
 
+# Centralized SQL logic for verdict and status to match Case model properties.
+# init_db() stores them as the generated verdict/is_active columns. There are
+# no lower() calls: LIKE and NOCASE already fold ASCII case, which is all
+# SQLite's lower() folds.
+VERDICT_SQL = """
+CASE 
+    WHEN (date IS NULL OR date = '' OR date COLLATE NOCASE IN ('not specified', 'not mentioned', 'unknown', 'none', 'not provided'))
+         AND (sentence_issued IS NULL OR sentence_issued = '' OR sentence_issued COLLATE NOCASE IN ('not specified', 'not mentioned', 'unknown', 'none'))
+    THEN 'Pending'
+    WHEN (sentence_issued LIKE '%acquitte%' OR sentence_issued LIKE '%not guilty%') THEN 'Acquittal'
+    WHEN (sentence_issued LIKE '%convict%' OR sentence_issued LIKE '%guilty%') THEN 'Conviction'
+    WHEN sentence_issued LIKE '%dismiss%' THEN 'Dismissed'
+    WHEN (summary LIKE '%acquittal%' OR summary LIKE '%acquitted%' OR summary LIKE '%not guilty%') THEN 'Acquittal'
+    WHEN (summary LIKE '%conviction%' OR summary LIKE '%convicted%' OR summary LIKE '%guilty%') THEN 'Conviction'
+    WHEN summary LIKE '%dismiss%' THEN 'Dismissed'
+    ELSE 'Decided'
+END
+"""
+
+IS_ACTIVE_SQL = """
+CASE 
+    WHEN (date IS NULL OR date = '' OR date COLLATE NOCASE IN ('not specified', 'not mentioned', 'unknown', 'none', 'not provided'))
+         AND (sentence_issued IS NULL OR sentence_issued = '' OR sentence_issued COLLATE NOCASE IN ('not specified', 'not mentioned', 'unknown', 'none'))
+    THEN 1
+    ELSE 0
+END
+"""
+
+
+# Column order matches the tuples built by json_to_rows()
+_INSERT_SQL = """
+    INSERT INTO cases (
+        corno, accused, complaintant, prosecution, court, judge, district,
+        chargesheet, plea, defense, sentence_issued, date, filing_date, summary
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Secondary indexes on cases: (name, definition)
+INDEXES = [
+    ("idx_cases_district", "cases(district)"),
+    ("idx_cases_judge", "cases(judge)"),
+    ("idx_cases_court", "cases(court)"),
+    ("idx_cases_district_court", "cases(district, court)"),
+    ("idx_cases_filing_date", "cases(filing_date DESC, id DESC)"),
+    ("idx_cases_verdict", "cases(verdict)"),
+    ("idx_cases_district_verdict", "cases(district, verdict)"),
+]
+
+
+def create_indexes(conn):
+    for name, definition in INDEXES:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+
+
+def drop_indexes(conn):
+    """Drop secondary indexes so a bulk load doesn't update them row by row."""
+    for name, _ in INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+
 def init_db():
     conn = get_db_connection()
+    # Persistent: readers no longer wait on writers
+    conn.execute("PRAGMA journal_mode=WAL")
     c = conn.cursor()
 
     # Create cases table
@@ -38,13 +173,30 @@ def init_db():
         )
     """)
 
+    # Ensure summary column exists (migration for existing DB)
+    try:
+        c.execute("ALTER TABLE cases ADD COLUMN summary TEXT")
+    except sqlite3.OperationalError:
+        pass  # Column likely exists
+
+    # Derived verdict/is_active columns (SQLite 3.31+). ALTER TABLE can only
+    # add VIRTUAL ones; their indexes below persist the computed values.
+    added_generated = False
+    try:
+        c.execute(
+            f"ALTER TABLE cases ADD COLUMN verdict TEXT GENERATED ALWAYS AS ({VERDICT_SQL}) VIRTUAL"
+        )
+        c.execute(
+            f"ALTER TABLE cases ADD COLUMN is_active INTEGER GENERATED ALWAYS AS ({IS_ACTIVE_SQL}) VIRTUAL"
+        )
+        added_generated = True
+    except sqlite3.OperationalError:
+        pass  # Columns likely exist
+
     # Create indexes for performance
-    c.execute("CREATE INDEX IF NOT EXISTS idx_cases_district ON cases(district)")
-    c.execute("CREATE INDEX IF NOT EXISTS idx_cases_judge ON cases(judge)")
-    c.execute("CREATE INDEX IF NOT EXISTS idx_cases_court ON cases(court)")
-    c.execute(
-        "CREATE INDEX IF NOT EXISTS idx_cases_filing_date ON cases(filing_date DESC, id DESC)"
-    )
+    create_indexes(c)
+    if added_generated:
+        c.execute("ANALYZE")
 
     # Check if empty
     c.execute("SELECT count(*) FROM cases")
@@ -53,6 +205,7 @@ def init_db():
         load_initial_data(c)
 
     conn.commit()
+    c.execute("PRAGMA optimize")
     conn.close()
 
 
@@ -63,8 +216,8 @@ def load_initial_data(cursor):
         return
 
     try:
-        with open(json_path, "r") as f:
-            data = json.load(f)
+        with open(json_path, "rb") as f:
+            data = orjson.loads(f.read())
 
         for item in data:
             # Handle alias
@@ -110,6 +263,15 @@ def parse_date(date_str):
 
     s = date_str.strip()
 
+    # Fast path: ISO dates (what the DB stores) parse in C without a format string
+    if len(s) == 10:
+        try:
+            d = date.fromisoformat(s)
+            if d.year <= _max_year():
+                return d
+        except ValueError:
+            pass
+
     # Try various formats
     formats = [
         "%Y-%m-%d",  # 2025-10-09
@@ -124,40 +286,23 @@ def parse_date(date_str):
 
     # Pre-cleaning for "nth", "st", "nd", "rd"
     # "30th December, 2025" -> "30 December, 2025"
-    s_clean = s
-    for suffix in ["st", "nd", "rd", "th"]:
-        # valid text date might contain 'th' in month name? No. "August" has 'st'.. wait.
-        # "August" ends in st? No. "August" -> "Augu". No.
-        # Be careful. only replace if preceded by digit.
-        import re
-
-        s_clean = re.sub(r"(\d+)" + suffix, r"\1", s_clean)
+    # Only strip when preceded by a digit, so month names like "August" are untouched.
+    s_clean = _ORD_COMBINED.sub(r"\1", s)
 
     for fmt in formats:
         try:
             d = datetime.strptime(s_clean, fmt).date()
-            # Basic validation: Year shouldn't be too far in future
-            if d.year > datetime.now().year + 1:
-                continue  # Likely OCR error (e.g. 2095)
-            return d
         except ValueError:
-            try:
-                d = datetime.strptime(s, fmt).date()  # Try original too
-                if d.year > datetime.now().year + 1:
-                    continue
-                return d
-            except ValueError:
-                continue
+            continue
+        # Basic validation: Year shouldn't be too far in future
+        if d.year > _max_year():
+            continue  # Likely OCR error (e.g. 2095)
+        return d
 
     # Handle verbose format: "Thursday, this the 09" day of October, 2025."
     try:
-        # Lowercase for easier matching
-        lower_s = s.lower()
-
-        # Remove ordinal suffixes st, nd, rd, th
-        import re
-
-        clean_s = re.sub(r"(\d+)(st|nd|rd|th)", r"\1", lower_s)
+        # Lowercase for easier matching (ordinal suffixes already stripped above)
+        clean_s = s_clean.lower()
 
         # Remove common words
         clean_s = (
@@ -171,49 +316,20 @@ def parse_date(date_str):
         # Let's try to extract Day, Month, Year using regex
 
         # Find 4 digit year
-        year_match = re.search(r"\b(20\d{2})\b", clean_s)
+        year_match = _YEAR_RE.search(clean_s)
         year = year_match.group(1) if year_match else None
 
         # Find Month (text)
-        months = {
-            "january": 1,
-            "february": 2,
-            "march": 3,
-            "april": 4,
-            "may": 5,
-            "june": 6,
-            "july": 7,
-            "august": 8,
-            "september": 9,
-            "october": 10,
-            "november": 11,
-            "december": 12,
-            "jan": 1,
-            "feb": 2,
-            "mar": 3,
-            "apr": 4,
-            "jun": 6,
-            "jul": 7,
-            "aug": 8,
-            "sep": 9,
-            "sept": 9,
-            "oct": 10,
-            "nov": 11,
-            "dec": 12,
-        }
-        month = None
-        for m_name, m_val in months.items():
-            if m_name in clean_s:
-                month = m_val
-                break
+        month_match = _MONTH_RE.search(clean_s)
+        month = _MONTH_TO_NUM[month_match.group(1)[:3]] if month_match else None
 
         # Find Day (1 or 2 digits)
-        day_match = re.search(r"\b([1-9]|[12]\d|3[01])\b", clean_s)
+        day_match = _DAY_RE.search(clean_s)
         day = day_match.group(1) if day_match else None
 
         if year and month and day:
             d = datetime(int(year), month, int(day)).date()
-            if d.year > datetime.now().year + 1:
+            if d.year > _max_year():
                 return None
             return d
 
@@ -223,17 +339,13 @@ def parse_date(date_str):
     return None
 
 
-def normalize_district(district_name):
-    if not district_name:
-        return "Unknown"
-
-    d = district_name.strip().lower()
-
+# District keyword groups in priority order: when an input mentions keywords
+# from several groups, the earliest group wins.
+_DISTRICT_TABLE = [
     # Ranga Reddy variations - MERGE ALL
-    # "r r" - spaces matter. "r r" is in "r r"
-    if any(
-        x in d
-        for x in [
+    # "maheshwar" covers "maheshwaram" and "maheshwar"
+    (
+        (
             "ranga",
             "r.r",
             "rr",
@@ -247,75 +359,92 @@ def normalize_district(district_name):
             "ibrahimpatnam",
             "alkapoor",
             "serilingampally",
-        ]
-    ):
-        # "maheshwar" covers "maheshwaram" and "maheshwar"
-        return "Ranga Reddy"
-
+        ),
+        "Ranga Reddy",
+    ),
     # Skip Lucknow (not in Telangana)
-    if "lucknow" in d:
-        return None
-
+    (("lucknow",), None),
     # Nalgonda — merge Yadadri Bhuvanagiri & Miryalaguda
-    if "nalgonda" in d or "miryalaguda" in d or "yadadri" in d or "bhongir" in d:
-        return "Nalgonda"
-
+    (("nalgonda", "miryalaguda", "yadadri", "bhongir"), "Nalgonda"),
     # Mahabubnagar — merge Nagarkurnool & Wanaparthy & Jogulamba Gadwal
-    if (
-        "mahabubnagar" in d
-        or "nagarkurnool" in d
-        or "wanaparthy" in d
-        or "jogulamba" in d
-        or "gadwal" in d
-    ):
-        return "Mahabubnagar"
-
+    (
+        ("mahabubnagar", "nagarkurnool", "wanaparthy", "jogulamba", "gadwal"),
+        "Mahabubnagar",
+    ),
     # Nizamabad — merge Pali & Ramareddy & Dichpally & Kamareddy
-    if (
-        "nizamabad" in d
-        or "pali" in d
-        or "ramareddy" in d
-        or "dichpally" in d
-        or "kamareddy" in d
-        or "yellareddy" in d
-    ):
-        return "Nizamabad"
-
-    # Adilabad
-    if "adilabad" in d:
-        return "Adilabad"
-
-    # Karimnagar
-    if "karimnagar" in d:
-        return "Karimnagar"
-
+    (
+        ("nizamabad", "pali", "ramareddy", "dichpally", "kamareddy", "yellareddy"),
+        "Nizamabad",
+    ),
+    (("adilabad",), "Adilabad"),
+    (("karimnagar",), "Karimnagar"),
     # Khammam — merge Bhadradri Kothagudem
-    if "khammam" in d or "bhadradri" in d:
-        return "Khammam"
+    (("khammam", "bhadradri"), "Khammam"),
+    (("warangal", "hanamkonda"), "Warangal"),
+    # Medak
+    (("sangareddy",), "Sangareddy"),
+    (("siddipet",), "Siddipet"),
+    (("medak",), "Medak"),
+    (("hyderabad", "secunderabad"), "Hyderabad"),
+    (("medchal", "malkajgiri", "kukatpally"), "Medchal-Malkajgiri"),
+    # Vikarabad (seen in some datasets, checking if relevant or default to Unknown/Raw)
+    (("vikarabad",), "Vikarabad"),
+]
+_KW_TO_CANONICAL = {}
+_KW_RANK = {}
+for _rank, (_keywords, _canonical) in enumerate(_DISTRICT_TABLE):
+    for _kw in _keywords:
+        _KW_TO_CANONICAL[_kw] = _canonical
+        _KW_RANK[_kw] = _rank
+
+# Zero-width lookahead so overlapping keywords are all reported in one scan
+_DISTRICT_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(kw) for kw in sorted(_KW_RANK, key=len, reverse=True))
+    + "))"
+)
+
+
+def _scan_district(d):
+    """Canonical name for the highest-ranked keyword found in d, else ""."""
+    hits = _DISTRICT_RE.findall(d)
+    if hits:
+        return _KW_TO_CANONICAL[min(hits, key=_KW_RANK.__getitem__)]
+    return ""
+
+
+# Already-clean canonical names resolve with a single dict hit; only names the
+# keyword scan maps to themselves, so the shortcut never changes a result
+_EXACT_DISTRICT = {
+    canonical.lower(): canonical
+    for _, canonical in _DISTRICT_TABLE
+    if canonical is not None and _scan_district(canonical.lower()) == canonical
+}
+
+_UNKNOWN_DISTRICTS = {
+    "not mentioned",
+    "not specified",
+    "unknown",
+    "[]",
+    "[district]",
+    "not provided",
+    "not specified in the provided text",
+}
 
-    # Warangal
-    if "warangal" in d or "hanamkonda" in d:
-        return "Warangal"
 
-    # Medak
-    if "sangareddy" in d:
-        return "Sangareddy"
-    if "siddipet" in d:
-        return "Siddipet"
-    if "medak" in d:
-        return "Medak"
+def normalize_district(district_name):
+    if not district_name:
+        return "Unknown"
 
-    # Hyderbad
-    if "hyderabad" in d or "secunderabad" in d:
-        return "Hyderabad"
+    d = district_name.strip().lower()
 
-    # Medchal
-    if "medchal" in d or "malkajgiri" in d or "kukatpally" in d:
-        return "Medchal-Malkajgiri"
+    hit = _EXACT_DISTRICT.get(d)
+    if hit:
+        return hit
 
-    # Vikarabad (seen in some datasets, checking if relevant or default to Unknown/Raw)
-    if "vikarabad" in d:
-        return "Vikarabad"
+    hit = _scan_district(d)
+    if hit != "":
+        return hit
 
     # Cleaning: Removing "District", "Dist", trailing "."
     clean = d.replace("district", "").replace("dist", "").replace(".", "").strip()
@@ -324,15 +453,7 @@ def normalize_district(district_name):
         return "Ranga Reddy"
 
     # Check for empty brackets or noise
-    if not clean or clean in [
-        "not mentioned",
-        "not specified",
-        "unknown",
-        "[]",
-        "[district]",
-        "not provided",
-        "not specified in the provided text",
-    ]:
+    if not clean or clean in _UNKNOWN_DISTRICTS:
         return "Unknown"
 
     return clean.title()
@@ -346,97 +467,118 @@ def clean_text(text):
     return str(text).strip()
 
 
-def load_from_json(data):
-    conn = get_db_connection()
-    c = conn.cursor()
-
-    # Ensure summary column exists (migration for existing DB)
-    try:
-        c.execute("ALTER TABLE cases ADD COLUMN summary TEXT")
-    except sqlite3.OperationalError:
-        pass  # Column likely exists
+def _clean_str(text):
+    """clean_text for scalar-only fields (skips the list check)."""
+    return str(text).strip() if text else ""
+
+
+def json_to_rows(data):
+    """Flatten one JSON document (list, flat dict, or metadata dict) into INSERT rows."""
+    items_to_process = []
+
+    if isinstance(data, list):
+        items_to_process = data
+    elif isinstance(data, dict):
+        # Check if it's the new single-item format with metadata
+        if "metadata" in data:
+            # Transform to flat structure
+            meta = data["metadata"]
+            item = {
+                "corno": meta.get("case_number"),
+                "accused": meta.get("accused_name"),
+                "complaintant": meta.get("complaintant"),
+                "prosecution": meta.get("prosecution_advocate"),
+                "court": meta.get("court"),
+                "judge": meta.get("judge"),
+                "district": meta.get("district"),
+                "chargesheet": meta.get("charges"),
+                "plea": meta.get("accused_plea"),
+                "defense": meta.get("defense_advocate"),
+                "sentence_issued": meta.get("sentence_issued"),
+                "date": meta.get("date_of_judgment"),
+                "summary": data.get("summary"),
+            }
+            items_to_process = [item]
+        else:
+            items_to_process = [data]  # Fallback for single flat object
+
+    clean = clean_text  # local lookup in the per-row loop
+    rows = []
+    for item in items_to_process:
+        # Skip placeholder case numbers
+        corno = clean(item.get("corno"))
+        if corno and corno.startswith("[") and corno.endswith("]"):
+            continue
+
+        # Handle alias
+        complaintant = item.get("complaintant") or item.get("complaininat")
+
+        # Parse date for sorting
+        date_str = item.get("date", "")
+        filing_date = parse_date(date_str)
+
+        # Normalize District
+        raw_district = item.get("district", "")
+        district = normalize_district(raw_district)
+
+        # Skip if district is None (e.g. Lucknow)
+        if district is None:
+            continue
+
+        rows.append(
+            (
+                corno,
+                clean(item.get("accused")),
+                clean(complaintant),
+                clean(item.get("prosecution")),
+                clean(item.get("court")),
+                clean(item.get("judge")),
+                district,
+                clean(item.get("chargesheet")),
+                clean(item.get("plea")),
+                clean(item.get("defense")),
+                clean(item.get("sentence_issued")),
+                _clean_str(date_str),
+                filing_date,
+                clean(item.get("summary")),
+            )
+        )
+    return rows
 
-    try:
-        count = 0
-        items_to_process = []
-
-        if isinstance(data, list):
-            items_to_process = data
-        elif isinstance(data, dict):
-            # Check if it's the new single-item format with metadata
-            if "metadata" in data:
-                # Transform to flat structure
-                meta = data["metadata"]
-                item = {
-                    "corno": meta.get("case_number"),
-                    "accused": meta.get("accused_name"),
-                    "complaintant": meta.get("complaintant"),
-                    "prosecution": meta.get("prosecution_advocate"),
-                    "court": meta.get("court"),
-                    "judge": meta.get("judge"),
-                    "district": meta.get("district"),
-                    "chargesheet": meta.get("charges"),
-                    "plea": meta.get("accused_plea"),
-                    "defense": meta.get("defense_advocate"),
-                    "sentence_issued": meta.get("sentence_issued"),
-                    "date": meta.get("date_of_judgment"),
-                    "summary": data.get("summary"),
-                }
-                items_to_process = [item]
-            else:
-                items_to_process = [data]  # Fallback for single flat object
-
-        for item in items_to_process:
-            # Skip placeholder case numbers
-            corno = clean_text(item.get("corno"))
-            if corno and corno.startswith("[") and corno.endswith("]"):
-                continue
 
-            # Handle alias
-            complaintant = item.get("complaintant") or item.get("complaininat")
+def insert_rows(conn, rows):
+    """Insert prepared row tuples with a single executemany call."""
+    conn.executemany(_INSERT_SQL, rows)
+    return len(rows)
 
-            # Parse date for sorting
-            date_str = item.get("date", "")
-            filing_date = parse_date(date_str)
 
-            # Normalize District
-            raw_district = item.get("district", "")
-            district = normalize_district(raw_district)
+def load_many_from_json(items_list, conn=None):
+    """Load several JSON documents in one transaction.
 
-            # Skip if district is None (e.g. Lucknow)
-            if district is None:
-                continue
+    Pass ``conn`` to reuse a caller-owned connection; otherwise one is
+    opened and closed here. The schema migration lives in init_db().
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection(bulk=True)
 
-            c.execute(
-                """
-                INSERT INTO cases (
-                    corno, accused, complaintant, prosecution, court, judge, district, 
-                    chargesheet, plea, defense, sentence_issued, date, filing_date, summary
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    clean_text(item.get("corno")),
-                    clean_text(item.get("accused")),
-                    clean_text(complaintant),
-                    clean_text(item.get("prosecution")),
-                    clean_text(item.get("court")),
-                    clean_text(item.get("judge")),
-                    district,
-                    clean_text(item.get("chargesheet")),
-                    clean_text(item.get("plea")),
-                    clean_text(item.get("defense")),
-                    clean_text(item.get("sentence_issued")),
-                    clean_text(date_str),
-                    filing_date,
-                    clean_text(item.get("summary")),
-                ),
-            )
-            if c.rowcount > 0:
-                count += 1
+    try:
+        rows = []
+        for data in items_list:
+            rows.extend(json_to_rows(data))
+        count = insert_rows(conn, rows)
         conn.commit()
+        if own_conn:
+            # Refresh planner stats the new rows may have skewed
+            conn.execute("PRAGMA optimize")
         return count
     except Exception as e:
         conn.rollback()
         raise e
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
+
+
+def load_from_json(data, conn=None):
+    return load_many_from_json([data], conn=conn)
@@ -1,23 +1,70 @@
-import json
 import sys
 import os
-import glob
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import orjson
 
 # Add current directory to path so we can import app modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from app.database import load_from_json, init_db, DB_NAME
+    from app.database import (
+        json_to_rows,
+        insert_rows,
+        init_db,
+        get_db_connection,
+        create_indexes,
+        drop_indexes,
+        DB_NAME,
+    )
 except ImportError:
     # Fallback if run from inside app/
     sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "app"))
-    from database import load_from_json, init_db, DB_NAME
+    from database import (
+        json_to_rows,
+        insert_rows,
+        init_db,
+        get_db_connection,
+        create_indexes,
+        drop_indexes,
+        DB_NAME,
+    )
 
 # Local directory containing all the summary JSON files
 SUMMARY_OUTPUT_DIR = os.path.expanduser(
     "~/docling_test/ExtractionPipeline/summary_output"
 )
 
+# Files per executemany + commit; bounds the rollback window on errors
+BATCH_SIZE = 1000
+
+# Files handed to the worker pool per round, per CPU; bounds how far the
+# directory walk and the parsed results run ahead of the inserts
+WINDOW_PER_CPU = 64
+
+
+def _iter_json_files(root):
+    """Yield *_summary.json paths under root, streaming as the tree is walked."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_json_files(entry.path)
+            elif entry.name.endswith("_summary.json") and entry.is_file():
+                yield entry.path
+
+
+def _parse_one(filepath):
+    """Parse and normalize one summary file (runs in a worker process).
+
+    Returns (filepath, rows, error) so failures are reported per file.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            return filepath, json_to_rows(orjson.loads(f.read())), None
+    except Exception as e:
+        return filepath, [], str(e)
+
 
 def fetch_and_load():
     print(f"Loading data from local directory: {SUMMARY_OUTPUT_DIR}")
@@ -26,40 +73,71 @@ def fetch_and_load():
         print(f"Error: Directory not found: {SUMMARY_OUTPUT_DIR}")
         return
 
-    # Delete existing DB for a fresh load
+    # Delete existing DB (and any WAL sidecar files) for a fresh load
     if os.path.exists(DB_NAME):
         os.remove(DB_NAME)
         print(f"Removed existing database: {DB_NAME}")
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(DB_NAME + suffix):
+            os.remove(DB_NAME + suffix)
 
     # Initialize fresh DB
     init_db()
 
-    # Find all JSON files recursively
-    json_files = glob.glob(
-        os.path.join(SUMMARY_OUTPUT_DIR, "**", "*_summary.json"), recursive=True
-    )
-    print(f"Found {len(json_files)} JSON files to process.")
-
     total_loaded = 0
     total_files = 0
     errors = 0
 
-    for filepath in json_files:
+    conn = get_db_connection(bulk=True)
+    # A crashed load is simply re-run from scratch, so skip fsyncs entirely
+    conn.execute("PRAGMA synchronous=OFF")
+    # Indexes are rebuilt once the data is in, rather than updated per row
+    drop_indexes(conn)
+    batch = []
+    batch_files = 0
+
+    def flush():
+        """Insert and commit the pending batch; a failure drops only it."""
+        nonlocal total_loaded, total_files, errors, batch_files
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                file_content = json.load(f)
-
-            count = load_from_json(file_content)
-            total_loaded += count
-            total_files += 1
-
-            # Print progress every 100 files
-            if total_files % 100 == 0:
-                print(f"  Processed {total_files}/{len(json_files)} files...")
-
+            total_loaded += insert_rows(conn, batch)
+            conn.commit()
+            total_files += batch_files
         except Exception as e:
-            errors += 1
-            print(f"  Error processing {os.path.basename(filepath)}: {e}")
+            conn.rollback()
+            errors += batch_files
+            print(f"  Error inserting a batch of {batch_files} files: {e}")
+        batch.clear()
+        batch_files = 0
+
+    # Parse files in worker processes; only the INSERTs run on this thread.
+    # Files are submitted a window at a time so the walk stays streamed.
+    paths = _iter_json_files(SUMMARY_OUTPUT_DIR)
+    window = WINDOW_PER_CPU * (os.cpu_count() or 1)
+    parsed = 0
+    with ProcessPoolExecutor() as pool:
+        while chunk := list(itertools.islice(paths, window)):
+            for filepath, rows, error in pool.map(_parse_one, chunk, chunksize=64):
+                if error is not None:
+                    errors += 1
+                    print(f"  Error processing {os.path.basename(filepath)}: {error}")
+                    continue
+
+                batch.extend(rows)
+                batch_files += 1
+                parsed += 1
+
+                if batch_files == BATCH_SIZE:
+                    flush()
+
+                # Print progress every 100 files
+                if parsed % 100 == 0:
+                    print(f"  Processed {parsed} files...")
+
+    flush()
+    create_indexes(conn)
+    conn.commit()
+    conn.close()
 
     print(
         f"\nDone! Processed {total_files} files. Loaded {total_loaded} records into the database."
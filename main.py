@@ -1,41 +1,59 @@
 from fastapi import FastAPI, Request, HTTPException, UploadFile, File, Form
 from fastapi.templating import Jinja2Templates
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, RedirectResponse
-from starlette.middleware.sessions import SessionMiddleware
+from fastapi.responses import (
+    HTMLResponse,
+    ORJSONResponse,
+    RedirectResponse,
+    Response,
+)
+import asyncio
+import functools
+import hashlib
 import os
-import json
-import glob
 import re
+import secrets
+import orjson
+from cachetools import TTLCache
 
 # Try imports to support both module execution (uvicorn app.main:app) and script execution (python3 main.py)
 try:
     from app.services import analytics
-except ImportError:
-    from services import analytics
-
-try:
     from app.auth import (
-        authenticate_user,
+        authenticate_user_async,
         get_display_name,
-        change_password,
-        change_username,
+        change_password_async,
+        change_username_async,
+    )
+    from app.database import (
+        init_db,
+        get_db_connection,
+        get_read_connection,
+        load_from_json,
     )
 except ImportError:
+    from services import analytics
     from auth import (
-        authenticate_user,
+        authenticate_user_async,
         get_display_name,
-        change_password,
-        change_username,
+        change_password_async,
+        change_username_async,
+    )
+    from database import (
+        init_db,
+        get_db_connection,
+        get_read_connection,
+        load_from_json,
     )
 
-app = FastAPI(title="Legal Analytics Dashboard")
+app = FastAPI(title="Legal Analytics Dashboard", default_response_class=ORJSONResponse)
 
-# Session secret for signed cookies
-# In production, set SESSION_SECRET env var to a strong random string
-SESSION_SECRET = os.environ.get(
-    "SESSION_SECRET", "change-me-to-a-strong-random-secret-key-in-production"
-)
+# Server-side sessions: the browser only holds a random session id cookie and
+# the session data stays in this process, expiring after 24h without use.
+SESSION_COOKIE = "sid"
+SESSION_MAX_AGE = 86400
+_SESSIONS = TTLCache(maxsize=10000, ttl=SESSION_MAX_AGE)
 
 # Setup templates
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -44,96 +62,160 @@ templates = Jinja2Templates(directory=TEMPLATES_DIR)
 
 
 # ─── Jinja2 Filters ─────────────────────────────────────────────────────────
+# Block-level markup emitted by md_to_html's line scanner.
+_MD_HEADINGS = {
+    1: '<h1 class="text-lg font-bold mt-6 mb-4 text-slate-900 dark:text-white">',
+    2: '<h2 class="text-base font-bold mt-5 mb-3 text-slate-800 dark:text-slate-200">',
+    3: '<h3 class="text-sm font-bold mt-4 mb-2 text-slate-800 dark:text-slate-200">',
+}
+_MD_HR = "<hr class='my-4 border-slate-300 dark:border-slate-600'/>"
+_MD_BLOCKQUOTE = "<blockquote class='border-l-4 border-slate-300 dark:border-slate-600 pl-4 italic my-2 text-slate-600 dark:text-slate-400'>"
+_MD_UL = '<ul class="list-disc pl-5 my-1 text-slate-600 dark:text-slate-400">'
+_MD_OL = '<ol class="list-decimal pl-5 my-1 text-slate-600 dark:text-slate-400">'
+_MD_OL_MARKER_RE = re.compile(r"\s*\d+\.")
+
+# Convert **bold** to <strong>; runs once over the assembled output
+_MD_BOLD_SUB = re.compile(r"\*\*([^*]+?)\*\*").sub
+_MD_BOLD_REPL = (
+    r"<strong class='font-semibold text-slate-700 dark:text-slate-300'>\1</strong>"
+)
+
+# Any character that can start markdown markup; text without one is plain
+_MD_CHAR_RE = re.compile(r"[*#>\-]|^\s*\d+\.", re.MULTILINE)
+
+# Line kinds that never get a <br> before or after them
+_MD_BLOCK_KINDS = frozenset(("ul", "ol", "blockquote", "hr"))
+
+
+def _md_block_body(lines, i, rest):
+    """Return (body, last line index) for the text after a block marker.
+
+    The marker must be followed by whitespace. A marker with nothing after it
+    takes its body from the next non-blank line, as the old `\\s+(.*)$` regexes did.
+    """
+    if rest[:1].isspace():
+        body = rest.lstrip()
+        if body:
+            return body, i
+    elif rest or i + 1 >= len(lines):
+        return None, i
+    for j in range(i + 1, len(lines)):
+        body = lines[j].lstrip()
+        if body:
+            return body, j
+    return "", len(lines) - 1
+
+
 def md_to_html(text):
     """Convert markdown bold (**text**) and line breaks to HTML."""
     if not text:
         return ""
     text = str(text)
+    if not _MD_CHAR_RE.search(text):
+        return text.replace("\n", "<br>")
+    lines = text.split("\n")
+
+    # Classify each line by its first character and emit its HTML. `kinds`
+    # tracks the block type of each output line so adjacent list items and
+    # quotes can be merged into the previous block.
+    out = []
+    kinds = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        c = line[:1]
+        kind = ""
+        if c == "#":
+            level = len(line) - len(line.lstrip("#"))
+            if level <= 3:
+                body, i = _md_block_body(lines, i, line[level:])
+                if body is not None:
+                    kind = "h"
+                    line = f"{_MD_HEADINGS[level]}{body}</h{level}>"
+        elif c == ">":
+            body, i = _md_block_body(lines, i, line[1:])
+            if body is not None:
+                # Consecutive quotes (blank lines between them included) merge
+                k = len(out)
+                while k and not kinds[k - 1] and not out[k - 1].strip():
+                    k -= 1
+                if k and kinds[k - 1] == "blockquote":
+                    del out[k:], kinds[k:]
+                    out[-1] = f"{out[-1][:-13]} {body}</blockquote>"
+                    i += 1
+                    continue
+                kind = "blockquote"
+                line = f"{_MD_BLOCKQUOTE}{body}</blockquote>"
+        elif line == "---":
+            kind = "hr"
+            line = _MD_HR
+        else:
+            stripped = line.lstrip()
+            c = stripped[:1]
+            body = None
+            if c == "-" or c == "*":
+                body, i = _md_block_body(lines, i, stripped[1:])
+                kind, tag = "ul", _MD_UL
+            elif c.isdigit():
+                m = _MD_OL_MARKER_RE.match(line)
+                if m:
+                    body, i = _md_block_body(lines, i, line[m.end() :])
+                    kind, tag = "ol", _MD_OL
+            if body is None:
+                kind = ""
+            else:
+                # List items swallow the blank lines above them, and
+                # adjacent items of the same type share one list
+                while kinds and not kinds[-1] and not out[-1].strip():
+                    out.pop()
+                    kinds.pop()
+                if kinds and kinds[-1] == kind:
+                    out[-1] = f"{out[-1][:-5]}<li>{body}</li></{kind}>"
+                    i += 1
+                    continue
+                line = f"{tag}<li>{body}</li></{kind}>"
+        out.append(line)
+        kinds.append(kind)
+        i += 1
+
+    # Join lines with <br>, except where either side is a list, quote or rule
+    parts = []
+    prev_block = True
+    for line, kind in zip(out, kinds):
+        block = kind in _MD_BLOCK_KINDS
+        if not (prev_block or block):
+            parts.append("<br>")
+        parts.append(line)
+        prev_block = block
+
+    return _MD_BOLD_SUB(_MD_BOLD_REPL, "".join(parts))
 
-    # 1. Convert headers (e.g., ### Heading -> <h3>Heading</h3>)
-    # Ensure this happens before bold conversion to avoid nesting strong tags inside h tags prematurely if not needed,
-    # but we can also just strip ** if they are in headers
-    text = re.sub(
-        r"^###\s+(.*)$",
-        r'<h3 class="text-sm font-bold mt-4 mb-2 text-slate-800 dark:text-slate-200">\1</h3>',
-        text,
-        flags=re.MULTILINE,
-    )
-    text = re.sub(
-        r"^##\s+(.*)$",
-        r'<h2 class="text-base font-bold mt-5 mb-3 text-slate-800 dark:text-slate-200">\1</h2>',
-        text,
-        flags=re.MULTILINE,
-    )
-    text = re.sub(
-        r"^#\s+(.*)$",
-        r'<h1 class="text-lg font-bold mt-6 mb-4 text-slate-900 dark:text-white">\1</h1>',
-        text,
-        flags=re.MULTILINE,
-    )
-
-    # Convert horizontal rules
-    text = re.sub(
-        r"^---$",
-        r"<hr class='my-4 border-slate-300 dark:border-slate-600'/>",
-        text,
-        flags=re.MULTILINE,
-    )
-
-    # Convert blockquotes
-    text = re.sub(
-        r"^>\s+(.*)$",
-        r"<blockquote class='border-l-4 border-slate-300 dark:border-slate-600 pl-4 italic my-2 text-slate-600 dark:text-slate-400'>\1</blockquote>",
-        text,
-        flags=re.MULTILINE,
-    )
-    text = re.sub(r"</blockquote>\s*<blockquote[^>]*>", " ", text)
-
-    # 2. Convert unordered lists
-    # Match `- item` or `* item`
-    text = re.sub(
-        r"^\s*[-*]\s+(.*)$",
-        r'<ul class="list-disc pl-5 my-1 text-slate-600 dark:text-slate-400"><li>\1</li></ul>',
-        text,
-        flags=re.MULTILINE,
-    )
-    # Combine adjacent </ul><ul...> into single lists
-    text = re.sub(r"</ul>\s*<ul[^>]*>", "", text)
-
-    # Convert ordered lists
-    text = re.sub(
-        r"^\s*\d+\.\s+(.*)$",
-        r'<ol class="list-decimal pl-5 my-1 text-slate-600 dark:text-slate-400"><li>\1</li></ol>',
-        text,
-        flags=re.MULTILINE,
-    )
-    text = re.sub(r"</ol>\s*<ol[^>]*>", "", text)
 
-    # 3. Convert **bold** to <strong>
-    text = re.sub(
-        r"\*\*([^*]+?)\*\*",
-        r"<strong class='font-semibold text-slate-700 dark:text-slate-300'>\1</strong>",
-        text,
-    )
+templates.env.filters["md_to_html"] = md_to_html
 
-    # 4. Convert \n to <br> (only for lines that aren't already wrapped in HTML blocks)
-    # A simple approach is to convert remaining \n to <br>, but avoid doing it between block tags.
-    # We will just do a simple replace for now.
-    text = text.replace("\n", "<br>")
-
-    # Optional cleanup for multiple <br> inside or around lists
-    text = re.sub(r"<br>\s*<(ul|ol|hr|blockquote)", r"<\1", text)
-    text = re.sub(r"</(ul|ol|blockquote)>\s*<br>", r"</\1>", text)
-    text = re.sub(
-        r"<hr[^>]*>\s*<br>",
-        r"<hr class='my-4 border-slate-300 dark:border-slate-600'/>",
-        text,
+# Compiled templates, looked up once at import instead of on every request.
+# Edits to templates/ therefore take effect only after a restart.
+_TPL = {
+    name: templates.env.get_template(name)
+    for name in (
+        "records.html",
+        "global.html",
+        "district.html",
+        "court.html",
+        "judge.html",
+        "case_details.html",
+        "login.html",
+        "settings.html",
+        "analysis_list.html",
+        "analysis_detail.html",
     )
+}
 
-    return text
 
+def render(template_name, request, **ctx):
+    """Render a cached template into an HTMLResponse."""
+    return HTMLResponse(_TPL[template_name].render(request=request, **ctx))
 
-templates.env.filters["md_to_html"] = md_to_html
 
 # Mount static files if needed (for now we use CDNs, but good practice to have)
 STATIC_DIR = os.path.join(BASE_DIR, "static")
@@ -141,12 +223,6 @@ if not os.path.exists(STATIC_DIR):
     os.makedirs(STATIC_DIR)
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
-# Load data on startup
-try:
-    from app.database import init_db, get_db_connection
-except ImportError:
-    from database import init_db, get_db_connection
-
 # Initialize the database
 init_db()
 
@@ -159,14 +235,13 @@ init_db()
 # Gates ALL routes behind login, except /login and /static assets.
 # No SQL involved — uses bcrypt comparison against JSON credential store.
 
+# Allow these paths without authentication
+_PUBLIC_PATHS = ("/login", "/static")
+
 
 @app.middleware("http")
 async def auth_middleware(request: Request, call_next):
-    # Allow these paths without authentication
-    public_paths = ["/login", "/static"]
-    path = request.url.path
-
-    if any(path.startswith(p) for p in public_paths):
+    if request.url.path.startswith(_PUBLIC_PATHS):
         return await call_next(request)
 
     # Check if user is authenticated via session
@@ -176,11 +251,40 @@ async def auth_middleware(request: Request, call_next):
     return await call_next(request)
 
 
-# SessionMiddleware MUST be added AFTER @app.middleware("http") so it becomes
-# the outermost layer and populates request.session before auth_middleware runs.
-app.add_middleware(
-    SessionMiddleware, secret_key=SESSION_SECRET, max_age=86400
-)  # 24h sessions
+# session_middleware MUST be added AFTER auth_middleware so it becomes the
+# outermost layer and populates request.session before auth_middleware runs.
+@app.middleware("http")
+async def session_middleware(request: Request, call_next):
+    sid = request.cookies.get(SESSION_COOKIE)
+    session = _SESSIONS.get(sid) if sid else None
+    if session is None:
+        sid = None
+        session = {}
+    request.scope["session"] = session
+
+    response = await call_next(request)
+
+    if session:
+        # New logins get a fresh id; existing ones have their expiry renewed
+        if sid is None:
+            sid = secrets.token_urlsafe(24)
+        _SESSIONS[sid] = session
+        response.set_cookie(
+            SESSION_COOKIE,
+            sid,
+            max_age=SESSION_MAX_AGE,
+            httponly=True,
+            samesite="lax",
+        )
+    elif sid is not None:
+        # Logged out (session cleared)
+        _SESSIONS.pop(sid, None)
+        response.delete_cookie(SESSION_COOKIE)
+    return response
+
+
+# Compress HTML/JSON responses over 1KB; outermost, so it sees final bodies
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 # ─── Auth Routes ─────────────────────────────────────────────────────────────
@@ -191,25 +295,23 @@ async def login_page(request: Request):
     # If already logged in, redirect to dashboard
     if request.session.get("authenticated"):
         return RedirectResponse(url="/", status_code=302)
-    return templates.TemplateResponse("login.html", {"request": request})
+    return render("login.html", request)
 
 
 @app.post("/login", response_class=HTMLResponse)
 async def login_submit(
     request: Request, username: str = Form(...), password: str = Form(...)
 ):
-    if authenticate_user(username, password):
+    if await authenticate_user_async(username, password):
         request.session["authenticated"] = True
         request.session["username"] = username
         request.session["display_name"] = get_display_name(username)
         return RedirectResponse(url="/", status_code=302)
     else:
-        return templates.TemplateResponse(
+        return render(
             "login.html",
-            {
-                "request": request,
-                "error": "Invalid username or password. Please try again.",
-            },
+            request,
+            error="Invalid username or password. Please try again.",
         )
 
 
@@ -221,13 +323,11 @@ async def logout(request: Request):
 
 @app.get("/settings", response_class=HTMLResponse)
 async def settings_page(request: Request):
-    return templates.TemplateResponse(
+    return render(
         "settings.html",
-        {
-            "request": request,
-            "username": request.session.get("username", ""),
-            "display_name": request.session.get("display_name", ""),
-        },
+        request,
+        username=request.session.get("username", ""),
+        display_name=request.session.get("display_name", ""),
     )
 
 
@@ -240,21 +340,22 @@ async def settings_change_password(
 ):
     username = request.session.get("username", "")
     ctx = {
-        "request": request,
         "username": username,
         "display_name": request.session.get("display_name", ""),
     }
 
     if new_password != confirm_password:
         ctx["error"] = "New passwords do not match."
-        return templates.TemplateResponse("settings.html", ctx)
+        return render("settings.html", request, **ctx)
 
-    success, message = change_password(username, current_password, new_password)
+    success, message = await change_password_async(
+        username, current_password, new_password
+    )
     if success:
         ctx["success"] = message
     else:
         ctx["error"] = message
-    return templates.TemplateResponse("settings.html", ctx)
+    return render("settings.html", request, **ctx)
 
 
 @app.post("/settings/change-username", response_class=HTMLResponse)
@@ -265,12 +366,13 @@ async def settings_change_username(
 ):
     current_username = request.session.get("username", "")
     ctx = {
-        "request": request,
         "username": current_username,
         "display_name": request.session.get("display_name", ""),
     }
 
-    success, message = change_username(current_username, new_username, password)
+    success, message = await change_username_async(
+        current_username, new_username, password
+    )
     if success:
         # Update session with new username
         request.session["username"] = new_username
@@ -280,38 +382,79 @@ async def settings_change_username(
         ctx["success"] = message
     else:
         ctx["error"] = message
-    return templates.TemplateResponse("settings.html", ctx)
+    return render("settings.html", request, **ctx)
 
 
-@app.get("/api/courts")
-async def get_courts(district: str = None):
-    conn = get_db_connection()
+# Short-lived cache of dashboard/dropdown results, keyed by (endpoint, params).
+# Cleared whenever new records are uploaded, or the database changes.
+_CACHE = TTLCache(maxsize=1024, ttl=300)
+
+# PRAGMA data_version on this connection changes whenever any other
+# connection commits, including the migrate_*.py / manage_db.py scripts.
+# Only the event loop touches it, so it needs no lock; it only reads that
+# one integer, so it returns plain tuples.
+_VERSION_DB = get_db_connection(check_same_thread=False)
+_VERSION_DB.row_factory = None
+_CACHE_VERSION = {"value": None}
+
+
+def _clear_cache_if_stale():
+    version = _VERSION_DB.execute("PRAGMA data_version").fetchone()[0]
+    if version != _CACHE_VERSION["value"]:
+        _CACHE.clear()
+        _CACHE_VERSION["value"] = version
+
+
+async def _cached(key, func, *args, **kwargs):
+    """Return the cached result for key, computing it in a worker thread on a miss."""
+    _clear_cache_if_stale()
+    try:
+        return _CACHE[key]
+    except KeyError:
+        pass
+    value = await asyncio.to_thread(func, *args, **kwargs)
+    _CACHE[key] = value
+    return value
+
+
+def _query_courts(district):
+    conn = get_read_connection()
     if district:
         result = conn.execute(
-            "SELECT DISTINCT court FROM cases WHERE district = ?", (district,)
+            "SELECT DISTINCT court FROM cases WHERE district = ? ORDER BY court",
+            (district,),
         ).fetchall()
     else:
-        result = conn.execute("SELECT DISTINCT court FROM cases").fetchall()
-    conn.close()
-    return {"courts": [row["court"] for row in result]}
+        result = conn.execute(
+            "SELECT DISTINCT court FROM cases ORDER BY court"
+        ).fetchall()
+    return [row["court"] for row in result]
+
+
+@app.get("/api/courts")
+async def get_courts(district: str = None):
+    courts = await _cached(("courts", district), _query_courts, district)
+    return ORJSONResponse({"courts": courts})
 
 
 @app.get("/", response_class=HTMLResponse)
-def read_global_dashboard(request: Request, analysis_type: str = "All Outcomes"):
-    stats = analytics.get_global_stats(analysis_type=analysis_type)
+async def read_global_dashboard(request: Request, analysis_type: str = "All Outcomes"):
+    stats = await _cached(
+        ("global", analysis_type),
+        analytics.get_global_stats,
+        analysis_type=analysis_type,
+    )
 
-    return templates.TemplateResponse(
+    return render(
         "global.html",
-        {
-            "request": request,
-            "analysis_type": analysis_type,  # Pass back to template to keep selection
-            **stats,
-        },
+        request,
+        analysis_type=analysis_type,  # Pass back to template to keep selection
+        **stats,
     )
 
 
 @app.get("/records", response_class=HTMLResponse)
-def read_records(
+async def read_records(
     request: Request,
     page: int = 1,
     search: str = None,
@@ -320,9 +463,12 @@ def read_records(
     court: str = None,
     start_date: str = None,
     end_date: str = None,
+    cursor_date: str = None,
+    cursor_id: int = None,
 ):
     # Use the new paginated service which is database-backed
-    result = analytics.get_paginated_records(
+    result = await asyncio.to_thread(
+        analytics.get_paginated_records,
         page=page,
         search=search,
         judge=judge,
@@ -330,6 +476,8 @@ def read_records(
         court=court,
         start_date=start_date,
         end_date=end_date,
+        cursor_date=cursor_date or None,
+        cursor_id=cursor_id,
     )
 
     filter_description = "All Case Records"
@@ -342,33 +490,29 @@ def read_records(
     elif search:
         filter_description = f"Search results for '{search}'"
 
-    return templates.TemplateResponse(
+    return render(
         "records.html",
-        {
-            "request": request,
-            "filter_description": filter_description,
-            "search_query": search or "",
-            "active_judge": judge or "",
-            "active_district": district or "",
-            "active_court": court or "",
-            "start_date": start_date or "",
-            "end_date": end_date or "",
-            **result,
-        },
+        request,
+        filter_description=filter_description,
+        search_query=search or "",
+        active_judge=judge or "",
+        active_district=district or "",
+        active_court=court or "",
+        start_date=start_date or "",
+        end_date=end_date or "",
+        **result,
     )
 
 
 @app.get("/case/{corno:path}", response_class=HTMLResponse)
-def read_case_details(request: Request, corno: str):
-    case = analytics.get_case_by_corno(corno)
+async def read_case_details(request: Request, corno: str):
+    case = await asyncio.to_thread(analytics.get_case_by_corno, corno)
 
     if not case:
         # Fallback or 404
         return HTMLResponse(content="Case not found", status_code=404)
 
-    return templates.TemplateResponse(
-        "case_details.html", {"request": request, "case": case}
-    )
+    return render("case_details.html", request, case=case)
 
 
 @app.post("/api/upload")
@@ -390,43 +534,44 @@ async def upload_json(request: Request):
 async def upload_file(file: UploadFile = File(...)):
     try:
         content = await file.read()
-        data = json.loads(content)
+        data = await asyncio.to_thread(orjson.loads, content)
+        del content
 
         # Load into DB
-        try:
-            from app.database import load_from_json
-        except ImportError:
-            from database import load_from_json
-
-        count = load_from_json(data)
+        count = await asyncio.to_thread(load_from_json, data)
+        _CACHE.clear()
 
-        return {"message": f"Successfully loaded {count} new records.", "count": count}
+        return ORJSONResponse(
+            {"message": f"Successfully loaded {count} new records.", "count": count}
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.get("/district/{district_name}", response_class=HTMLResponse)
-def read_district_dashboard(request: Request, district_name: str):
-    stats = analytics.get_district_stats(district_name)
+async def read_district_dashboard(request: Request, district_name: str):
+    stats = await _cached(
+        ("district", district_name), analytics.get_district_stats, district_name
+    )
 
-    return templates.TemplateResponse("district.html", {"request": request, **stats})
+    return render("district.html", request, **stats)
 
 
 @app.get("/court/{court_name}", response_class=HTMLResponse)
-def read_court_dashboard(request: Request, court_name: str):
-    stats = analytics.get_court_stats(court_name)
+async def read_court_dashboard(request: Request, court_name: str):
+    stats = await _cached(("court", court_name), analytics.get_court_stats, court_name)
 
-    return templates.TemplateResponse("court.html", {"request": request, **stats})
+    return render("court.html", request, **stats)
 
 
 @app.get("/judge/{judge_name}", response_class=HTMLResponse)
-def read_judge_dashboard(request: Request, judge_name: str):
-    stats = analytics.get_judge_stats(judge_name)
+async def read_judge_dashboard(request: Request, judge_name: str):
+    stats = await _cached(("judge", judge_name), analytics.get_judge_stats, judge_name)
 
     # Handle simple decoding if passed from URL encoded
     # judge_name usually works fine with FastAPI path params but just in case
 
-    return templates.TemplateResponse("judge.html", {"request": request, **stats})
+    return render("judge.html", request, **stats)
 
 
 # ─── Analysis Documents helpers ──────────────────────────────────────────────
@@ -434,23 +579,83 @@ def read_judge_dashboard(request: Request, judge_name: str):
 ANALYSIS_DIR = os.path.join(BASE_DIR, "analysis_documents")
 NPA_ANALYSIS_DIR = os.path.join(BASE_DIR, "npa_analysis_documents")
 
+# Shared read-only default for section lookups; never mutated
+_EMPTY: dict = {}
+
+# Patterns shared by the analysis parsers, compiled once
+_CODE_FENCE_RE = re.compile(r"^\s*```\w*\s*$", re.MULTILINE)
+_HEADING_LINE_RE = re.compile(r"^\s*#+ .*$", re.MULTILINE)
+_HR_LINE_RE = re.compile(r"^\s*---+\s*$", re.MULTILINE)
+_BOLD_RE = re.compile(r"\*\*([^*]*?)\*\*")
+_PIPE_LINE_RE = re.compile(r"^\s*(\|.*)$", re.MULTILINE)
+_SECTION_SPLIT_RE = re.compile(r"^##\s+(.*)", re.MULTILINE)
+_TRAILING_HR_RE = re.compile(r"\n*---+\s*$")
+_BLOCKQUOTE_SCORE_RE = re.compile(
+    r">\s*\*\*[a-zA-Z\s]*Score:\s*(\d+)(?:/10)?.*?\*\*", re.IGNORECASE
+)
+_JUSTIFICATION_RE = re.compile(r">\s*\*\*Justification:\*\*\s*(.*?)(?=\n|$)")
+_BLOCKQUOTE_LINE_RE = re.compile(r"^>.*$", re.MULTILINE)
+_FALLBACK_COURT_RE = re.compile(
+    r"(?:heard by the|before the|in the court of|presided over by)\s+(.+?)(?:\s+(?:on|in|at)\s+\d|\.\s)",
+    re.IGNORECASE,
+)
+_FALLBACK_CASE_NUMBER_RE = re.compile(
+    r"((?:Spl\.)?(?:S\.?C\.?|SC|Cr|CC|Crl\.?M\.?A)[\s.]*No\.?\s*[\d/]+\s*(?:of\s*\d{4})?)",
+    re.IGNORECASE,
+)
+_FALLBACK_JUDGMENT_DATE_RE = re.compile(r"\*\*([^*]+)\*\*.*?Judgment", re.IGNORECASE)
+_FALLBACK_PARTIES_RE = re.compile(
+    r"(State\s+of\s+\w+)\s+(?:against|vs\.?|versus)\s+(?:the\s+accused,?\s*(?:identified as\s+)?)?([A-Z][a-zA-Z\s.]+?)(?:,|\.\s|\s+a\s+\d)"
+)
+_PROCESSED_ON_RE = re.compile(r"\*Processed on:\s+(.*?)\*")
+_CONV_RE = re.compile(
+    r"found guilty|convicted|guilty of all charges|conviction", re.IGNORECASE
+)
+_ACQ_RE = re.compile(r"acquitted|acquittal|not guilty", re.IGNORECASE)
+_META_PAREN_DATE_RE = re.compile(r"([\d-]+)\s*\((.+)\)")
+_META_PLUS_DATE_RE = re.compile(r"(.+?)\s*\+\s*(.+)")
+_META_ISO_RE = re.compile(r"ISO:\s*([\d-]+)")
+_META_NATURAL_RE = re.compile(r"Natural\s*Text:\s*(.+?)(?:<br>|$)", re.IGNORECASE)
+
+# Analysis detail parsing
+_LEGAL_ITEM_SPLIT_RE = re.compile(
+    r"^(?:#{1,6}\s*)?(?:\*\*)?(\d+\.\s+(?:\*\*)?[^\n*:]+)(?:\*\*)?:?[^\S\n]*$",
+    re.MULTILINE,
+)
+_LEGAL_ITEM_START_RE = re.compile(r"^\s*(?:#{1,6}\s*)?(?:\*\*)?\d+\.\s+")
+_LEADING_NUMBER_RE = re.compile(r"^\d+\.\s*")
+_TIMELINE_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*:\s*(.*)")
+_TIMELINE_BULLET_BOLD_RE = re.compile(r"-\s+\*\*([^*]+)\*\*:\s*(.*)")
+# Per-line severity score forms, matched against stripped audit lines
+_OVERALL_SCORE_LINE_RE = re.compile(r"\*\*Score:\s*(\d+)", re.IGNORECASE)
+_LAPSE_SCORE_RE = re.compile(r"Lapse Severity Score:\s*(?:\*\*)?(\d+)", re.IGNORECASE)
+_LINE_SCORE_RE = re.compile(r".*?Score:\s*(?:\*\*)?(\d+)", re.IGNORECASE)
+# Score and "Observations/Lapses" lines that the audit parser skips, in one scan
+_AUDIT_SKIP_RE = re.compile(
+    r"(?i:Lapse Severity Score)|(?i:^\s*(?:\*\*)?Score:)|Observations/Lapses"
+)
+_AUDIT_HEADING_RE = re.compile(r"^#{2,4}\s+(?:\*\*)?(.*?)(?:\*\*)?:?\s*$")
+_AUDIT_ALT_HEADING_RE = re.compile(r"^\*\*([^*]+)\*\*:?\s*$")
+_AUDIT_BULLET_BOLD_RE = re.compile(r"^(?:-|\*|\d+\.)\s+\*\*([^*]+)\*\*:?\s*(.*)")
+_NUMBERED_ITEM_RE = re.compile(r"^(?:\d+\.)\s+(.*)")
+
 
 def strip_code_fences(text: str) -> str:
     """Remove ```markdown ... ``` wrappers, heading lines, and horizontal rules."""
     if not text:
         return text
     # Remove code fence lines
-    text = re.sub(r"^\s*```\w*\s*$", "", text, flags=re.MULTILINE)
+    text = _CODE_FENCE_RE.sub("", text)
     # Remove heading lines like "# Metadata Extraction"
-    text = re.sub(r"^\s*#+ .*$", "", text, flags=re.MULTILINE)
+    text = _HEADING_LINE_RE.sub("", text)
     # Remove horizontal rules
-    text = re.sub(r"^\s*---+\s*$", "", text, flags=re.MULTILINE)
+    text = _HR_LINE_RE.sub("", text)
     return text.strip()
 
 
 def strip_bold(text: str) -> str:
     """Remove ** markdown bold markers from text."""
-    return re.sub(r"\*\*([^*]*?)\*\*", r"\1", text) if text else text
+    return _BOLD_RE.sub(r"\1", text) if text else text
 
 
 def parse_markdown_table(md_table: str) -> list[dict]:
@@ -464,10 +669,9 @@ def parse_markdown_table(md_table: str) -> list[dict]:
     if not cleaned:
         return []
 
-    lines = [l.strip() for l in cleaned.split("\n") if l.strip()]  # noqa: E741
     # Need at least header + separator + 1 row
     # Determine table lines by preserving only lines starting with |
-    table_lines = [line for line in lines if line.startswith("|")]
+    table_lines = [line.rstrip() for line in _PIPE_LINE_RE.findall(cleaned)]
     if len(table_lines) < 3:
         return []
 
@@ -510,6 +714,57 @@ def parse_markdown_table(md_table: str) -> list[dict]:
     return rows
 
 
+# Metadata key substrings and the normalized field they map to, checked in
+# order; keys containing "date" are handled by _parse_meta_date.
+_META_DISPATCH = [
+    ("full court", "court"),
+    ("presiding", "judge"),
+    ("case number", "case_number"),
+    ("citation", "case_number"),
+    ("parties", "parties"),
+]
+
+
+def _parse_meta_date(lk: str, val_clean: str, out: dict) -> None:
+    """Fill date_iso / date_natural in out from a date-like metadata field."""
+    # Handle various date formats:
+    # "Date of Judgement (ISO + Natural Text)": "2025-12-15 (Monday, 15th December 2025)"
+    # "Date of Judgement": "ISO: 2025-12-15<br>Natural Text: 15th day of December, 2025"
+    # "date" with "iso" and "natural" in the key
+    if "iso" in lk and "natural" in lk:
+        # Combined field header like "Date of Judgement (ISO + Natural Text)"
+        # Value might be "2025-12-15 (Monday, 15th December 2025)"
+        paren_match = _META_PAREN_DATE_RE.match(val_clean)
+        plus_match = _META_PLUS_DATE_RE.match(val_clean)
+        if paren_match:
+            out["date_iso"] = paren_match.group(1).strip()
+            out["date_natural"] = paren_match.group(2).strip()
+        elif plus_match:
+            out["date_iso"] = plus_match.group(1).strip()
+            out["date_natural"] = plus_match.group(2).strip()
+        else:
+            out["date_natural"] = val_clean
+    elif "natural" in lk:
+        out["date_natural"] = val_clean
+    elif "iso" in lk:
+        out["date_iso"] = val_clean
+    else:
+        # Generic "Date of Judgement" field
+        # Check if value contains ISO: and Natural Text: sub-fields
+        iso_match = _META_ISO_RE.search(val_clean)
+        nat_match = _META_NATURAL_RE.search(val_clean)
+        paren_match = _META_PAREN_DATE_RE.match(val_clean)
+        if iso_match:
+            out["date_iso"] = iso_match.group(1).strip()
+        if nat_match:
+            out["date_natural"] = nat_match.group(1).strip()
+        elif paren_match:
+            out["date_iso"] = paren_match.group(1).strip()
+            out["date_natural"] = paren_match.group(2).strip()
+        elif not iso_match:
+            out["date_natural"] = val_clean
+
+
 def normalize_metadata(raw: dict) -> dict:
     """Normalize metadata keys so templates always get consistent fields."""
     out = {}
@@ -518,53 +773,13 @@ def normalize_metadata(raw: dict) -> dict:
         key_clean = strip_bold(key)
         val_clean = strip_bold(val)
         lk = key_clean.lower().strip()
-        if "full court" in lk:
-            out["court"] = val_clean
-        elif lk == "presiding judges" or "presiding" in lk:
-            out["judge"] = val_clean
-        elif "case number" in lk or "citation" in lk:
-            out["case_number"] = val_clean
-        elif "parties" in lk:
-            out["parties"] = val_clean
-        elif "date" in lk:
-            # Handle various date formats:
-            # "Date of Judgement (ISO + Natural Text)": "2025-12-15 (Monday, 15th December 2025)"
-            # "Date of Judgement": "ISO: 2025-12-15<br>Natural Text: 15th day of December, 2025"
-            # "date" with "iso" and "natural" in the key
-            if "iso" in lk and "natural" in lk:
-                # Combined field header like "Date of Judgement (ISO + Natural Text)"
-                # Value might be "2025-12-15 (Monday, 15th December 2025)"
-                paren_match = re.match(r"([\d-]+)\s*\((.+)\)", val_clean)
-                plus_match = re.match(r"(.+?)\s*\+\s*(.+)", val_clean)
-                if paren_match:
-                    out["date_iso"] = paren_match.group(1).strip()
-                    out["date_natural"] = paren_match.group(2).strip()
-                elif plus_match:
-                    out["date_iso"] = plus_match.group(1).strip()
-                    out["date_natural"] = plus_match.group(2).strip()
-                else:
-                    out["date_natural"] = val_clean
-            elif "natural" in lk:
-                out["date_natural"] = val_clean
-            elif "iso" in lk:
-                out["date_iso"] = val_clean
-            else:
-                # Generic "Date of Judgement" field
-                # Check if value contains ISO: and Natural Text: sub-fields
-                iso_match = re.search(r"ISO:\s*([\d-]+)", val_clean)
-                nat_match = re.search(
-                    r"Natural\s*Text:\s*(.+?)(?:<br>|$)", val_clean, re.IGNORECASE
-                )
-                paren_match = re.match(r"([\d-]+)\s*\((.+)\)", val_clean)
-                if iso_match:
-                    out["date_iso"] = iso_match.group(1).strip()
-                if nat_match:
-                    out["date_natural"] = nat_match.group(1).strip()
-                elif paren_match:
-                    out["date_iso"] = paren_match.group(1).strip()
-                    out["date_natural"] = paren_match.group(2).strip()
-                elif not iso_match:
-                    out["date_natural"] = val_clean
+        for needle, out_key in _META_DISPATCH:
+            if needle in lk:
+                out[out_key] = val_clean
+                break
+        else:
+            if "date" in lk:
+                _parse_meta_date(lk, val_clean, out)
     return out
 
 
@@ -577,39 +792,24 @@ def fallback_metadata_from_content(
         return meta
 
     # Try to extract court name — patterns like "heard by the <court name> in/at/on"
-    court_match = re.search(
-        r"(?:heard by the|before the|in the court of|presided over by)\s+(.+?)(?:\s+(?:on|in|at)\s+\d|\.\s)",
-        legal_summary,
-        re.IGNORECASE,
-    )
+    court_match = _FALLBACK_COURT_RE.search(legal_summary)
     if court_match:
         meta["court"] = court_match.group(1).strip().rstrip(",.")
 
     # Try to extract case number — patterns like "SC.No.X of YYYY" or "Cr.No.X/YYYY"
-    case_match = re.search(
-        r"((?:Spl\.)?(?:S\.?C\.?|SC|Cr|CC|Crl\.?M\.?A)[\s.]*No\.?\s*[\d/]+\s*(?:of\s*\d{4})?)",
-        legal_summary,
-        re.IGNORECASE,
-    )
+    case_match = _FALLBACK_CASE_NUMBER_RE.search(legal_summary)
     if case_match:
         meta["case_number"] = case_match.group(1).strip()
 
     # Try to extract date from timeline if available
     if timeline_content:
         # Look for Judgment Date in timeline
-        judgment_match = re.search(
-            r"\*\*([^*]+)\*\*.*?Judgment",
-            timeline_content,
-            re.IGNORECASE,
-        )
+        judgment_match = _FALLBACK_JUDGMENT_DATE_RE.search(timeline_content)
         if judgment_match:
             meta["date_natural"] = judgment_match.group(1).strip()
 
     # Try to extract parties — "State of X against/vs Y" or "X vs Y"
-    parties_match = re.search(
-        r"(State\s+of\s+\w+)\s+(?:against|vs\.?|versus)\s+(?:the\s+accused,?\s*(?:identified as\s+)?)?([A-Z][a-zA-Z\s.]+?)(?:,|\.\s|\s+a\s+\d)",
-        legal_summary,
-    )
+    parties_match = _FALLBACK_PARTIES_RE.search(legal_summary)
     if parties_match:
         meta["parties"] = (
             f"{parties_match.group(1).strip()} vs {parties_match.group(2).strip()}"
@@ -623,7 +823,7 @@ def parse_markdown_sections(md_text: str) -> dict:
     sections = {}
 
     # Split the document by '## <Section Title>'
-    parts = re.split(r"^##\s+(.*)", md_text, flags=re.MULTILINE)
+    parts = _SECTION_SPLIT_RE.split(md_text)
 
     # parts[0] is everything before the first '## ', typically header and *Processed on*
     for i in range(1, len(parts), 2):
@@ -631,29 +831,23 @@ def parse_markdown_sections(md_text: str) -> dict:
         content = parts[i + 1].strip()
 
         # Remove trailing horizontal rules from the content
-        content = re.sub(r"\n*---+\s*$", "", content).strip()
+        content = _TRAILING_HR_RE.sub("", content).strip()
 
         sec_data = {"content": content}
 
         if "Investigation Quality Audit" in title:
             # Extract severity score from blockquote: > **Lapse Severity Score: 7/10 (🟠 SEVERE)**
-            score_match = re.search(
-                r">\s*\*\*[a-zA-Z\s]*Score:\s*(\d+)(?:/10)?.*?\*\*",
-                content,
-                re.IGNORECASE,
-            )
+            score_match = _BLOCKQUOTE_SCORE_RE.search(content)
             if score_match:
                 sec_data["severity_score"] = int(score_match.group(1))
 
             # Extract justification from blockquote
-            just_match = re.search(
-                r">\s*\*\*Justification:\*\*\s*(.*?)(?=\n|$)", content
-            )
+            just_match = _JUSTIFICATION_RE.search(content)
             if just_match:
                 sec_data["score_justification"] = just_match.group(1).strip()
 
             # Clean up the blockquotes from the content so the sub-section parser runs cleanly
-            content = re.sub(r"^>.*$", "", content, flags=re.MULTILINE)
+            content = _BLOCKQUOTE_LINE_RE.sub("", content)
             sec_data["content"] = content.strip()
 
         sections[title] = sec_data
@@ -661,252 +855,319 @@ def parse_markdown_sections(md_text: str) -> dict:
     return sections
 
 
+# Parsed analysis-list entries keyed by file path, reused while the file's
+# (mtime, size) is unchanged. Kept in memory only; a restart re-parses once.
+_PARSE_CACHE = {}
+
+
+def _list_files(directory: str, suffix: str) -> tuple:
+    """Return (path, mtime_ns, size) for the regular files in directory ending
+    with suffix, sorted by path, from one scandir pass."""
+    files = []
+    try:
+        with os.scandir(directory) as it:
+            for e in it:
+                if (
+                    e.name.endswith(suffix)
+                    and not e.name.startswith(".")
+                    and e.is_file()
+                ):
+                    st = e.stat()
+                    files.append((e.path, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return tuple(sorted(files))
+
+
+def _cached_parse(files: tuple, parse, *args) -> list[dict | None]:
+    """Return [parse(path, *args) for each file], reusing cached results for
+    files whose stamp is unchanged and parsing the rest.
+
+    files are _list_files() tuples, so no file is stat'ed twice.
+    """
+    entries = {}
+    misses = []
+    for fpath, mtime_ns, size in files:
+        stamp = (mtime_ns, size)
+        hit = _PARSE_CACHE.get(fpath)
+        if hit is not None and hit[0] == stamp:
+            entries[fpath] = hit[1]
+        else:
+            misses.append((fpath, stamp))
+
+    # Parsed in-process: the corpus is small and only changed files get here
+    for fpath, stamp in misses:
+        entry = parse(fpath, *args)
+        _PARSE_CACHE[fpath] = (stamp, entry)
+        entries[fpath] = entry
+
+    return [entries.get(f[0]) for f in files]
+
+
+def _extract_severity(audit_content: str, default: int | None) -> int | None:
+    """Pick the severity score out of an audit section's content.
+
+    An "Overall Lapse Severity Score" block wins, then the first "Lapse
+    Severity Score:"; if neither is present and there is no default, the
+    last "Score:" line is used. Same per-line rules as _parse_audit().
+    """
+    if not audit_content:
+        return default
+    overall_armed = False
+    lapse = last = None
+    for line in audit_content.split("\n"):
+        low = line.lower()
+        if "score" not in low:
+            continue
+        if overall_armed:
+            score_match = _OVERALL_SCORE_LINE_RE.match(line.strip())
+            if score_match:
+                return int(score_match.group(1))
+        if "overall lapse severity score" in low:
+            overall_armed = True
+        if lapse is None:
+            score_match = _LAPSE_SCORE_RE.search(line)
+            if score_match:
+                lapse = int(score_match.group(1))
+        if default is None:
+            score_match = _LINE_SCORE_RE.match(line)
+            if score_match:
+                last = int(score_match.group(1))
+    if lapse is not None:
+        return lapse
+    if last is not None:
+        return last
+    return default
+
+
+# The list parse and the detail view ask for the same file's outcome with
+# the same summary; keyed on the whole summary since the scan covers all of it
+@functools.lru_cache(maxsize=1024)
 def extract_outcome_from_filename(filename: str, legal_summary: str = "") -> str:
     """Get case outcome from filename prefix, falling back to content analysis."""
     upper = filename.upper()
     if upper.startswith("ACQUITTED"):
         return "Acquitted"
-    elif upper.startswith("CONVICTED") or upper.startswith("CONVICTION"):
+    elif upper.startswith(("CONVICTED", "CONVICTION")):
         return "Convicted"
     # Fallback: parse from legal summary content
     if legal_summary:
-        lower = legal_summary.lower()
-        if any(
-            kw in lower
-            for kw in [
-                "found guilty",
-                "convicted",
-                "guilty of all charges",
-                "conviction",
-            ]
-        ):
+        if _CONV_RE.search(legal_summary):
             return "Convicted"
-        if any(kw in lower for kw in ["acquitted", "acquittal", "not guilty"]):
+        if _ACQ_RE.search(legal_summary):
             return "Acquitted"
     return "Unknown"
 
 
-def load_json_analyses(
-    directory: str, source_label: str, slug_prefix: str
-) -> list[dict]:
-    """Scan a directory for .json analysis files and return summary dicts."""
-    results = []
-    json_files = sorted(glob.glob(os.path.join(directory, "*.json")))
+def _parse_json_analysis(
+    fpath: str, source_label: str, slug_prefix: str
+) -> dict | None:
+    """Parse one .json analysis file into a summary dict."""
+    try:
+        with open(fpath, "rb") as f:
+            data = orjson.loads(f.read())
+    except Exception:
+        return None
 
-    for fpath in json_files:
-        try:
-            with open(fpath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception:
-            continue
+    fname = os.path.basename(fpath)
+    stem = os.path.splitext(fname)[0]  # e.g. "1" or "ACQUITTED_...analysis"
+    slug = f"{slug_prefix}_{stem}"
+
+    file_name = data.get("file_name", fname)
+    processed_on = data.get("processed_on", "")
+    sections = data.get("sections", _EMPTY)
 
-        fname = os.path.basename(fpath)
-        stem = os.path.splitext(fname)[0]  # e.g. "1" or "ACQUITTED_...analysis"
-        slug = f"{slug_prefix}_{stem}"
+    # Legal summary
+    legal_sec = (
+        sections["Comprehensive Legal Summary"]
+        if "Comprehensive Legal Summary" in sections
+        else sections.get("Judgment at a Glance", _EMPTY)
+    )
+    legal_summary = legal_sec.get("content", "") if isinstance(legal_sec, dict) else ""
 
-        file_name = data.get("file_name", fname)
-        processed_on = data.get("processed_on", "")
-        sections = data.get("sections", {})
+    outcome = extract_outcome_from_filename(file_name, legal_summary)
 
-        # Legal summary
-        legal_sec = sections.get(
-            "Comprehensive Legal Summary", sections.get("Judgment at a Glance", {})
+    # Metadata
+    meta_sec = sections.get("Metadata Extraction", _EMPTY)
+    meta_content = meta_sec.get("content", "") if isinstance(meta_sec, dict) else ""
+    meta_rows = parse_markdown_table(meta_content)
+    meta_raw = meta_rows[0] if meta_rows else {}
+    meta = normalize_metadata(meta_raw)
+    if not meta:
+        timeline_raw = sections.get("Chronological Event Timeline", _EMPTY)
+        timeline_content = (
+            timeline_raw.get("content", "") if isinstance(timeline_raw, dict) else ""
         )
-        legal_summary = (
-            legal_sec.get("content", "") if isinstance(legal_sec, dict) else ""
+        meta = fallback_metadata_from_content(legal_summary, timeline_content)
+
+    # Severity
+    audit = sections.get("Investigation Quality Audit", _EMPTY)
+    severity = None
+    if isinstance(audit, dict):
+        severity = _extract_severity(
+            audit.get("content", ""), audit.get("severity_score", None)
         )
 
-        outcome = extract_outcome_from_filename(file_name, legal_summary)
-
-        # Metadata
-        meta_sec = sections.get("Metadata Extraction", {})
-        meta_content = meta_sec.get("content", "") if isinstance(meta_sec, dict) else ""
-        meta_rows = parse_markdown_table(meta_content)
-        meta_raw = meta_rows[0] if meta_rows else {}
-        meta = normalize_metadata(meta_raw)
-        if not meta:
-            timeline_raw = sections.get("Chronological Event Timeline", {})
-            timeline_content = (
-                timeline_raw.get("content", "")
-                if isinstance(timeline_raw, dict)
-                else ""
-            )
-            meta = fallback_metadata_from_content(legal_summary, timeline_content)
-
-        # Severity
-        audit = sections.get("Investigation Quality Audit", {})
-        severity = None
-        if isinstance(audit, dict):
-            severity = audit.get("severity_score", None)
-            audit_content = audit.get("content", "")
-            if audit_content:
-                # Override with Overall Lapse Severity Score if present
-                overall_match = re.search(
-                    r"Overall Lapse Severity Score.*?\n\s*\*\*Score:\s*(\d+)",
-                    audit_content,
-                    re.IGNORECASE | re.DOTALL,
-                )
-                if overall_match:
-                    severity = int(overall_match.group(1))
-                else:
-                    lapse_match = re.search(
-                        r"Lapse Severity Score:\s*(?:\*\*)?(\d+)",
-                        audit_content,
-                        re.IGNORECASE,
-                    )
-                    if lapse_match:
-                        severity = int(lapse_match.group(1))
-                    elif severity is None:
-                        all_scores = re.findall(
-                            r"(?:^|\n)[^\n]*?Score:\s*(?:\*\*)?(\d+)",
-                            audit_content,
-                            re.IGNORECASE,
-                        )
-                        if all_scores:
-                            severity = int(all_scores[-1])
-
-        summary_snippet = (
-            legal_summary[:200] + "..." if len(legal_summary) > 200 else legal_summary
-        )
+    summary_snippet = (
+        legal_summary[:200] + "..." if len(legal_summary) > 200 else legal_summary
+    )
 
-        results.append(
-            {
-                "slug": slug,
-                "filename": file_name,
-                "processed_on": processed_on,
-                "outcome": outcome,
-                "court": meta.get("court", ""),
-                "judge": meta.get("judge", ""),
-                "date": meta.get("date_natural", meta.get("date_iso", "")),
-                "case_number": meta.get("case_number", ""),
-                "parties": meta.get("parties", ""),
-                "severity_score": severity,
-                "summary_snippet": summary_snippet,
-                "source": source_label,
-            }
-        )
+    return {
+        "slug": slug,
+        "filename": file_name,
+        "processed_on": processed_on,
+        "outcome": outcome,
+        "court": meta.get("court", ""),
+        "judge": meta.get("judge", ""),
+        "date": (
+            meta["date_natural"] if "date_natural" in meta else meta.get("date_iso", "")
+        ),
+        "case_number": meta.get("case_number", ""),
+        "parties": meta.get("parties", ""),
+        "severity_score": severity,
+        "summary_snippet": summary_snippet,
+        "source": source_label,
+    }
+
+
+def load_json_analyses(
+    json_files: tuple, source_label: str, slug_prefix: str
+) -> list[dict]:
+    """Return summary dicts for the .json analysis files from _list_files()."""
+    results = []
+
+    for entry in _cached_parse(
+        json_files, _parse_json_analysis, source_label, slug_prefix
+    ):
+        if entry is not None:
+            results.append(entry)
 
     return results
 
 
-def load_analysis_list() -> dict:
-    """Scan analysis_documents/ and npa_analysis_documents/ and return summary data."""
-    analyses = []
-    severity_scores = []
-    outcomes = {"Acquitted": 0, "Convicted": 0, "Unknown": 0}
+def _parse_md_analysis(fpath: str) -> dict | None:
+    """Parse one *_analysis.md file into a summary dict."""
+    try:
+        with open(fpath, "r", encoding="utf-8") as f:
+            md_text = f.read()
+    except Exception:
+        return None
 
-    # ── 1. Markdown files from analysis_documents/ ──
-    md_files = sorted(glob.glob(os.path.join(ANALYSIS_DIR, "*_analysis.md")))
+    fname = os.path.basename(fpath)
+    slug = fname.replace("_analysis.md", "")
 
-    for fpath in md_files:
-        try:
-            with open(fpath, "r", encoding="utf-8") as f:
-                md_text = f.read()
-        except Exception:
-            continue
+    # Extract processed_on from the top
+    processed_on = ""
+    po_match = _PROCESSED_ON_RE.search(md_text)
+    if po_match:
+        processed_on = po_match.group(1).strip()
 
-        fname = os.path.basename(fpath)
-        slug = fname.replace("_analysis.md", "")
+    sections = parse_markdown_sections(md_text)
 
-        # Extract processed_on from the top
-        processed_on = ""
-        po_match = re.search(r"\*Processed on:\s+(.*?)\*", md_text)
-        if po_match:
-            processed_on = po_match.group(1).strip()
+    # Legal summary might be under different titles
+    legal_sec = (
+        sections["Judgment at a Glance"]
+        if "Judgment at a Glance" in sections
+        else sections.get("Comprehensive Legal Summary", _EMPTY)
+    )
+    legal_summary = legal_sec.get("content", "")
 
-        sections = parse_markdown_sections(md_text)
+    outcome = extract_outcome_from_filename(fname, legal_summary)
 
-        # Legal summary might be under different titles
-        legal_sec = sections.get(
-            "Judgment at a Glance", sections.get("Comprehensive Legal Summary", {})
-        )
-        legal_summary = legal_sec.get("content", "")
-
-        outcome = extract_outcome_from_filename(fname, legal_summary)
-        outcomes[outcome] = outcomes.get(outcome, 0) + 1
-
-        # Extract metadata fields from the table
-        meta_content = sections.get("Metadata Extraction", {}).get("content", "")
-        meta_rows = parse_markdown_table(meta_content)
-        meta_raw = meta_rows[0] if meta_rows else {}
-        meta = normalize_metadata(meta_raw)
-        # Fallback: extract metadata from legal summary when table is empty
-        if not meta:
-            timeline_raw = sections.get("Chronological Event Timeline", {}).get(
-                "content", ""
-            )
-            meta = fallback_metadata_from_content(legal_summary, timeline_raw)
-
-        # Severity score
-        audit = sections.get("Investigation Quality Audit", {})
-        severity = audit.get("severity_score", None)
-        audit_content = audit.get("content", "") if isinstance(audit, dict) else ""
-        if audit_content:
-            overall_match = re.search(
-                r"Overall Lapse Severity Score.*?\n\s*\*\*Score:\s*(\d+)",
-                audit_content,
-                re.IGNORECASE | re.DOTALL,
-            )
-            if overall_match:
-                severity = int(overall_match.group(1))
-            else:
-                lapse_match = re.search(
-                    r"Lapse Severity Score:\s*(?:\*\*)?(\d+)",
-                    audit_content,
-                    re.IGNORECASE,
-                )
-                if lapse_match:
-                    severity = int(lapse_match.group(1))
-                elif severity is None:
-                    all_scores = re.findall(
-                        r"(?:^|\n)[^\n]*?Score:\s*(?:\*\*)?(\d+)",
-                        audit_content,
-                        re.IGNORECASE,
-                    )
-                    if all_scores:
-                        severity = int(all_scores[-1])
-        if severity is not None:
-            severity_scores.append(severity)
-
-        # Legal summary snippet (first 200 chars)
-        summary_snippet = (
-            legal_summary[:200] + "..." if len(legal_summary) > 200 else legal_summary
+    # Extract metadata fields from the table
+    meta_content = sections.get("Metadata Extraction", _EMPTY).get("content", "")
+    meta_rows = parse_markdown_table(meta_content)
+    meta_raw = meta_rows[0] if meta_rows else {}
+    meta = normalize_metadata(meta_raw)
+    # Fallback: extract metadata from legal summary when table is empty
+    if not meta:
+        timeline_raw = sections.get("Chronological Event Timeline", _EMPTY).get(
+            "content", ""
         )
+        meta = fallback_metadata_from_content(legal_summary, timeline_raw)
+
+    # Severity score
+    audit = sections.get("Investigation Quality Audit", _EMPTY)
+    audit_content = audit.get("content", "") if isinstance(audit, dict) else ""
+    severity = _extract_severity(audit_content, audit.get("severity_score", None))
+
+    # Legal summary snippet (first 200 chars)
+    summary_snippet = (
+        legal_summary[:200] + "..." if len(legal_summary) > 200 else legal_summary
+    )
+
+    return {
+        "slug": slug,
+        "filename": fname,
+        "processed_on": processed_on,
+        "outcome": outcome,
+        "court": meta.get("court", ""),
+        "judge": meta.get("judge", ""),
+        "date": (
+            meta["date_natural"] if "date_natural" in meta else meta.get("date_iso", "")
+        ),
+        "case_number": meta.get("case_number", ""),
+        "parties": meta.get("parties", ""),
+        "severity_score": severity,
+        "summary_snippet": summary_snippet,
+        "source": "Standard",
+    }
 
-        analyses.append(
-            {
-                "slug": slug,
-                "filename": fname,
-                "processed_on": processed_on,
-                "outcome": outcome,
-                "court": meta.get("court", ""),
-                "judge": meta.get("judge", ""),
-                "date": meta.get("date_natural", meta.get("date_iso", "")),
-                "case_number": meta.get("case_number", ""),
-                "parties": meta.get("parties", ""),
-                "severity_score": severity,
-                "summary_snippet": summary_snippet,
-                "source": "Standard",
-            }
-        )
+
+# Last load_analysis_list() result and the file stamps it was built from
+_LIST_CACHE = {"key": None, "value": None}
+
+
+def _analysis_files_key() -> tuple:
+    """Fingerprint of every analysis document: (path, mtime_ns, size) per
+    file, so in-place rewrites count as well as added or removed files.
+
+    Returns (md_files, std_json_files, npa_json_files); _load_analysis_list()
+    parses from the same stamps, so each file is stat'ed once per request.
+    """
+    return (
+        _list_files(ANALYSIS_DIR, "_analysis.md"),
+        _list_files(ANALYSIS_DIR, ".json"),
+        _list_files(NPA_ANALYSIS_DIR, ".json"),
+    )
+
+
+def load_analysis_list(key: tuple | None = None) -> dict:
+    """Scan analysis_documents/ and npa_analysis_documents/ and return summary data.
+
+    key is a _analysis_files_key() the caller already took.
+    """
+    if key is None:
+        key = _analysis_files_key()
+    if _LIST_CACHE["key"] == key:
+        return _LIST_CACHE["value"]
+    value = _load_analysis_list(key)
+    _LIST_CACHE["key"], _LIST_CACHE["value"] = key, value
+    return value
+
+
+def _load_analysis_list(key: tuple) -> dict:
+    md_files, std_files, npa_files = key
+
+    # ── 1. Markdown files from analysis_documents/ ──
+    analyses = [e for e in _cached_parse(md_files, _parse_md_analysis) if e]
 
     # ── 2. JSON files from analysis_documents/ ──
-    std_json = load_json_analyses(ANALYSIS_DIR, "Standard", "std")
-    analyses.extend(std_json)
+    analyses.extend(load_json_analyses(std_files, "Standard", "std"))
 
     # ── 3. JSON files from npa_analysis_documents/ ──
-    npa_json = load_json_analyses(NPA_ANALYSIS_DIR, "NPA", "npa")
-    analyses.extend(npa_json)
+    analyses.extend(load_json_analyses(npa_files, "NPA", "npa"))
 
-    # Update outcomes & severity from all entries
-    for a in std_json + npa_json:
+    # Outcome counts and severity average in one pass over all entries
+    outcomes = {"Acquitted": 0, "Convicted": 0, "Unknown": 0}
+    severity_total = severity_count = 0
+    for a in analyses:
         outcomes[a["outcome"]] = outcomes.get(a["outcome"], 0) + 1
         if a["severity_score"] is not None:
-            severity_scores.append(a["severity_score"])
+            severity_total += a["severity_score"]
+            severity_count += 1
 
-    avg_severity = (
-        round(sum(severity_scores) / len(severity_scores), 1) if severity_scores else 0
-    )
+    avg_severity = round(severity_total / severity_count, 1) if severity_count else 0
 
     return {
         "analyses": analyses,
@@ -916,34 +1177,208 @@ def load_analysis_list() -> dict:
     }
 
 
+# Section titles the witness table may appear under, in order of preference
+_WITNESS_SECTIONS = (
+    "Principal Witnesses & Ex.PW Extraction",
+    "Witnesses Extracted",
+    "Principal Witnesses",
+)
+
+
+def _parse_legal_items(legal_raw: str) -> list[dict]:
+    """Split a legal summary into titled items for the tabbed display."""
+    legal_items = []
+    if not legal_raw:
+        return legal_items
+
+    parts = _LEGAL_ITEM_SPLIT_RE.split(legal_raw)
+
+    current_title = ""
+    preamble = parts[0].strip() if parts else ""
+    if preamble and not _LEGAL_ITEM_START_RE.search(parts[0]):
+        legal_items.append({"title": "Overview", "content": preamble})
+
+    for i in range(1, len(parts), 2):
+        if i < len(parts):
+            # Peel "*"/"#" markup off both ends, a leading "1." number, then
+            # any markup that was inside the number, e.g. "1. **Title**"
+            current_title = parts[i].strip().strip("*#").strip()
+            if current_title[:1].isdigit():
+                current_title = _LEADING_NUMBER_RE.sub("", current_title)
+            current_title = current_title.strip("*#").strip()
+
+        content = parts[i + 1].strip() if i + 1 < len(parts) else ""
+
+        if current_title:
+            legal_items.append({"title": current_title, "content": content})
+
+    if not legal_items:
+        legal_items.append({"title": "Summary", "content": legal_raw})
+    return legal_items
+
+
+def _parse_audit(
+    audit_content: str, severity_score: int | None
+) -> tuple[int | None, list[dict]]:
+    """Split an audit section into headed sub-sections and pick its
+    severity score, falling back to severity_score from the section keys."""
+    audit_subsections = []
+    if not audit_content:
+        return severity_score, audit_subsections
+
+    current_heading = ""
+    current_items = []
+    overall_armed = False
+    overall_score = lapse_score = last_score = None
+    # Strip the body once; the fallback below reuses it
+    body = audit_content.strip()
+    for line in body.split("\n"):
+        original_line = line
+        line = line.strip()
+        if not line or line == "---":
+            continue
+
+        # Collect severity candidates on the same walk: the first
+        # "**Score: N" line after the "Overall Lapse Severity Score"
+        # heading, the first "Lapse Severity Score: N", the last "Score: N"
+        low = line.lower()
+        if "score" in low:
+            if overall_score is None:
+                if overall_armed:
+                    score_match = _OVERALL_SCORE_LINE_RE.match(line)
+                    if score_match:
+                        overall_score = int(score_match.group(1))
+                if "overall lapse severity score" in low:
+                    overall_armed = True
+            if lapse_score is None:
+                score_match = _LAPSE_SCORE_RE.search(line)
+                if score_match:
+                    lapse_score = int(score_match.group(1))
+            score_match = _LINE_SCORE_RE.match(line)
+            if score_match:
+                last_score = int(score_match.group(1))
+
+        # Skip score line so it doesn't become a header
+        if "score" in low or "Observations/Lapses" in line:
+            if _AUDIT_SKIP_RE.search(line):
+                continue
+
+        # The stripped line's first character decides which of the line
+        # patterns can match at all, so only those are run
+        head = line[0]
+
+        # Match either `### Heading` or `## **1. Lapses**` or `**Heading**: `
+        heading_match = _AUDIT_HEADING_RE.match(line) if head == "#" else None
+        alt_heading_match = _AUDIT_ALT_HEADING_RE.match(line) if head == "*" else None
+
+        if alt_heading_match and (
+            "Score:" in line
+            or len(line) > 60
+            or "Observations" in line
+            or "Rationale" in line
+        ):
+            alt_heading_match = None
+
+        if heading_match or alt_heading_match:
+            if current_heading:
+                audit_subsections.append(
+                    {"heading": current_heading, "items": current_items}
+                )
+            if heading_match:
+                current_heading = heading_match.group(1).strip().rstrip(":")
+            else:
+                current_heading = alt_heading_match.group(1).strip().rstrip(":")
+            current_heading = (
+                current_heading.removeprefix("**").removesuffix("**").strip()
+            )
+            current_items = []
+        else:
+            bullet_bold_match = (
+                _AUDIT_BULLET_BOLD_RE.match(line)
+                if head in "-*" or head.isdigit()
+                else None
+            )
+            if bullet_bold_match:
+                current_items.append(
+                    {
+                        "title": bullet_bold_match.group(1).strip(),
+                        "detail": bullet_bold_match.group(2).strip(),
+                    }
+                )
+            else:
+                top_level_match = (
+                    _NUMBERED_ITEM_RE.match(line) if head.isdigit() else None
+                )
+                if (
+                    top_level_match
+                    and not original_line.startswith(" ")
+                    and not original_line.startswith("\t")
+                ):
+                    current_items.append(
+                        {"title": "", "detail": top_level_match.group(1).strip()}
+                    )
+                else:
+                    if current_items:
+                        if current_items[-1]["detail"]:
+                            current_items[-1]["detail"] += "\n" + line
+                        else:
+                            current_items[-1]["detail"] = line
+                    else:
+                        current_items.append({"title": "", "detail": line})
+
+    if current_heading:
+        audit_subsections.append({"heading": current_heading, "items": current_items})
+
+    # Always prefer the OVERALL severity score from the content body
+    # because the top-level key can sometimes be a department sub-score
+    if overall_score is not None:
+        severity_score = overall_score
+    elif lapse_score is not None:
+        severity_score = lapse_score
+    elif not severity_score and last_score is not None:
+        severity_score = last_score
+
+    # Fallback: if no structured sub-sections are found, just use the remaining text
+    if not audit_subsections and body:
+        audit_subsections.append(
+            {
+                "heading": "Audit Summary",
+                "items": [{"title": "", "detail": body}],
+            }
+        )
+    return severity_score, audit_subsections
+
+
 def load_json_analysis_detail(fpath: str, slug: str) -> dict | None:
     """Load and parse a single JSON analysis file into the detail view format."""
     if not os.path.exists(fpath):
         return None
 
     try:
-        with open(fpath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(fpath, "rb") as f:
+            data = orjson.loads(f.read())
     except Exception:
         return None
 
     file_name = data.get("file_name", os.path.basename(fpath))
     processed_on = data.get("processed_on", "")
-    sections = data.get("sections", {})
+    sections = data.get("sections", _EMPTY)
 
     # Metadata
-    meta_sec = sections.get("Metadata Extraction", {})
+    meta_sec = sections.get("Metadata Extraction", _EMPTY)
     meta_content = meta_sec.get("content", "") if isinstance(meta_sec, dict) else ""
     meta_rows = parse_markdown_table(meta_content)
     metadata_raw = meta_rows[0] if meta_rows else {}
     metadata = normalize_metadata(metadata_raw)
 
     # Legal summary
-    legal_sec = sections.get(
-        "Comprehensive Legal Summary", sections.get("Judgment at a Glance", {})
+    legal_sec = (
+        sections["Comprehensive Legal Summary"]
+        if "Comprehensive Legal Summary" in sections
+        else sections.get("Judgment at a Glance", _EMPTY)
     )
     legal_raw = legal_sec.get("content", "") if isinstance(legal_sec, dict) else ""
-    timeline_sec = sections.get("Chronological Event Timeline", {})
+    timeline_sec = sections.get("Chronological Event Timeline", _EMPTY)
     timeline_raw = (
         timeline_sec.get("content", "") if isinstance(timeline_sec, dict) else ""
     )
@@ -952,44 +1387,20 @@ def load_json_analysis_detail(fpath: str, slug: str) -> dict | None:
         metadata = fallback_metadata_from_content(legal_raw, timeline_raw)
 
     # Witnesses
-    witnesses_sec = sections.get("Principal Witnesses & Ex.PW Extraction", {})
-    if not witnesses_sec:
-        witnesses_sec = sections.get("Witnesses Extracted", {})
-    if not witnesses_sec:
-        witnesses_sec = sections.get("Principal Witnesses", {})
+    for title in _WITNESS_SECTIONS:
+        witnesses_sec = sections.get(title, _EMPTY)
+        if witnesses_sec:
+            break
     witnesses_content = (
         witnesses_sec.get("content", "") if isinstance(witnesses_sec, dict) else ""
     )
     witnesses = parse_markdown_table(witnesses_content)
 
     # Legal summary items
-    legal_items = []
-    if legal_raw:
-        pattern = r"(?:^|\n)(?:#{1,6}\s*)?(?:\*\*)?(\d+\.\s+(?:\*\*)?[^\n*:]+)(?:\*\*)?:?\s*(?=\n|$)"
-        parts = re.split(pattern, legal_raw)
-
-        current_title = ""
-        preamble = parts[0].strip() if parts else ""
-        if preamble and not re.search(r"^\s*(?:#{1,6}\s*)?(?:\*\*)?\d+\.\s+", parts[0]):
-            legal_items.append({"title": "Overview", "content": preamble})
-
-        for i in range(1, len(parts), 2):
-            if i < len(parts):
-                current_title = parts[i].strip()
-                current_title = re.sub(r"^[\*\#]+|[\*\#]+$", "", current_title).strip()
-                current_title = re.sub(r"^\d+\.\s*", "", current_title).strip()
-                current_title = re.sub(r"^[\*\#]+|[\*\#]+$", "", current_title).strip()
-
-            content = parts[i + 1].strip() if i + 1 < len(parts) else ""
-
-            if current_title:
-                legal_items.append({"title": current_title, "content": content})
-
-        if not legal_items:
-            legal_items.append({"title": "Summary", "content": legal_raw})
+    legal_items = _parse_legal_items(legal_raw)
 
     # Taxonomy
-    taxonomy_sec = sections.get("Taxonomy & Classification", {})
+    taxonomy_sec = sections.get("Taxonomy & Classification", _EMPTY)
     taxonomy_content = (
         taxonomy_sec.get("content", "") if isinstance(taxonomy_sec, dict) else ""
     )
@@ -1010,7 +1421,8 @@ def load_json_analysis_detail(fpath: str, slug: str) -> dict | None:
             line = line.strip().lstrip("- ")
             if not line:
                 continue
-            bold_match = re.match(r"\*\*([^*]+)\*\*:\s*(.*)", line)
+            # Only a line opening with "**" can carry a bold label
+            bold_match = _TIMELINE_BOLD_RE.match(line) if line[:2] == "**" else None
             if bold_match:
                 timeline_items.append(
                     {
@@ -1022,7 +1434,7 @@ def load_json_analysis_detail(fpath: str, slug: str) -> dict | None:
                 timeline_items.append({"label": "", "detail": line})
 
     # Audit
-    audit_section = sections.get("Investigation Quality Audit", {})
+    audit_section = sections.get("Investigation Quality Audit", _EMPTY)
     audit_content = (
         audit_section.get("content", "") if isinstance(audit_section, dict) else ""
     )
@@ -1035,123 +1447,7 @@ def load_json_analysis_detail(fpath: str, slug: str) -> dict | None:
         else ""
     )
 
-    # Always try to extract the OVERALL severity score from content body
-    # because the top-level key can sometimes be a department sub-score
-    if audit_content:
-        # First, try to find the overall score (after "Overall Lapse Severity Score" heading)
-        overall_match = re.search(
-            r"Overall Lapse Severity Score.*?\n\s*\*\*Score:\s*(\d+)",
-            audit_content,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if overall_match:
-            severity_score = int(overall_match.group(1))
-        else:
-            # Try "Lapse Severity Score: N" pattern (always overrides top-level)
-            lapse_match = re.search(
-                r"Lapse Severity Score:\s*(?:\*\*)?(\d+)",
-                audit_content,
-                re.IGNORECASE,
-            )
-            if lapse_match:
-                severity_score = int(lapse_match.group(1))
-            elif not severity_score:
-                # Fallback: find last "Score: N" line (the overall is usually at the end)
-                all_scores = re.findall(
-                    r"(?:^|\n)[^\n]*?Score:\s*(?:\*\*)?(\d+)",
-                    audit_content,
-                    re.IGNORECASE,
-                )
-                if all_scores:
-                    severity_score = int(all_scores[-1])
-
-    audit_subsections = []
-    if audit_content:
-        current_heading = ""
-        current_items = []
-        for line in audit_content.strip().split("\n"):
-            original_line = line
-            line = line.strip()
-            if not line or line == "---":
-                continue
-
-            # Skip score line so it doesn't become a header
-            if (
-                re.search(r"Lapse Severity Score", line, re.IGNORECASE)
-                or re.search(r"^\s*(?:\*\*)?Score:", line, re.IGNORECASE)
-                or "Observations/Lapses" in line
-            ):
-                continue
-
-            # Match strict markdown headings like `### Heading` or `## **1. Department Lapses**`
-            heading_match = re.match(r"^#{2,4}\s+(?:\*\*)?(.*?)(?:\*\*)?:?\s*$", line)
-            alt_heading_match = re.match(r"^\*\*([^*]+)\*\*:?\s*$", line)
-
-            if alt_heading_match and (
-                "Score:" in line
-                or len(line) > 60
-                or "Observations" in line
-                or "Rationale" in line
-            ):
-                alt_heading_match = None
-
-            if heading_match or alt_heading_match:
-                if current_heading:
-                    audit_subsections.append(
-                        {"heading": current_heading, "items": current_items}
-                    )
-                current_heading = (
-                    (
-                        heading_match.group(1)
-                        if heading_match
-                        else alt_heading_match.group(1)
-                    )
-                    .strip()
-                    .rstrip(":")
-                )
-                current_heading = re.sub(r"^\*\*|\*\*$", "", current_heading).strip()
-                current_items = []
-            else:
-                bullet_bold_match = re.match(
-                    r"^(?:-|\*|\d+\.)\s+\*\*([^*]+)\*\*:?\s*(.*)", line
-                )
-                if bullet_bold_match:
-                    current_items.append(
-                        {
-                            "title": bullet_bold_match.group(1).strip(),
-                            "detail": bullet_bold_match.group(2).strip(),
-                        }
-                    )
-                else:
-                    top_level_match = re.match(r"^(?:\d+\.)\s+(.*)", line)
-                    if (
-                        top_level_match
-                        and not original_line.startswith(" ")
-                        and not original_line.startswith("\t")
-                    ):
-                        current_items.append(
-                            {"title": "", "detail": top_level_match.group(1).strip()}
-                        )
-                    else:
-                        if current_items:
-                            if current_items[-1]["detail"]:
-                                current_items[-1]["detail"] += "\n" + line
-                            else:
-                                current_items[-1]["detail"] = line
-                        else:
-                            current_items.append({"title": "", "detail": line})
-
-        if current_heading:
-            audit_subsections.append(
-                {"heading": current_heading, "items": current_items}
-            )
-        if not audit_subsections and audit_content.strip():
-            audit_subsections.append(
-                {
-                    "heading": "Audit Summary",
-                    "items": [{"title": "", "detail": audit_content.strip()}],
-                }
-            )
+    severity_score, audit_subsections = _parse_audit(audit_content, severity_score)
 
     outcome = extract_outcome_from_filename(file_name, legal_raw)
     # Determine source from slug prefix
@@ -1174,104 +1470,94 @@ def load_json_analysis_detail(fpath: str, slug: str) -> dict | None:
     }
 
 
-def load_analysis_detail(slug: str) -> dict | None:
-    """Load and parse a single analysis by its slug (supports md, std JSON, and NPA JSON)."""
+def _analysis_detail_path(slug: str) -> str:
+    """Map a slug to its file (supports md, std JSON, and NPA JSON)."""
     # Handle NPA JSON slugs  (npa_1, npa_2, ...)
     if slug.startswith("npa_"):
         stem = slug[4:]  # remove "npa_" prefix
-        fpath = os.path.join(NPA_ANALYSIS_DIR, f"{stem}.json")
-        return load_json_analysis_detail(fpath, slug)
+        return os.path.join(NPA_ANALYSIS_DIR, f"{stem}.json")
 
     # Handle Standard JSON slugs  (std_ACQUITTED_...)
     if slug.startswith("std_"):
         stem = slug[4:]  # remove "std_" prefix
-        fpath = os.path.join(ANALYSIS_DIR, f"{stem}.json")
-        return load_json_analysis_detail(fpath, slug)
+        return os.path.join(ANALYSIS_DIR, f"{stem}.json")
 
     # Original: markdown files
-    fpath = os.path.join(ANALYSIS_DIR, f"{slug}_analysis.md")
-    if not os.path.exists(fpath):
+    return os.path.join(ANALYSIS_DIR, f"{slug}_analysis.md")
+
+
+def load_analysis_detail(slug: str) -> dict | None:
+    """Load and parse a single analysis by its slug (supports md, std JSON, and NPA JSON)."""
+    fpath = _analysis_detail_path(slug)
+    try:
+        mtime_ns = os.stat(fpath).st_mtime_ns
+    except OSError:
         return None
+    return _load_analysis_detail(slug, fpath, mtime_ns)
+
+
+# mtime_ns is part of the key so an edited file is re-parsed on next view
+@functools.lru_cache(maxsize=256)
+def _load_analysis_detail(slug: str, fpath: str, mtime_ns: int) -> dict | None:
+    if slug.startswith(("npa_", "std_")):
+        return load_json_analysis_detail(fpath, slug)
 
     with open(fpath, "r", encoding="utf-8") as f:
         md_text = f.read()
 
     processed_on = ""
-    po_match = re.search(r"\*Processed on:\s+(.*?)\*", md_text)
+    po_match = _PROCESSED_ON_RE.search(md_text)
     if po_match:
         processed_on = po_match.group(1).strip()
 
     sections = parse_markdown_sections(md_text)
 
     # Parse metadata table
-    meta_content = sections.get("Metadata Extraction", {}).get("content", "")
+    meta_content = sections.get("Metadata Extraction", _EMPTY).get("content", "")
     meta_rows = parse_markdown_table(meta_content)
     metadata_raw = meta_rows[0] if meta_rows else {}
     metadata = normalize_metadata(metadata_raw)
 
     # Legal summary might be under different titles
-    legal_sec = sections.get(
-        "Judgment at a Glance", sections.get("Comprehensive Legal Summary", {})
+    legal_sec = (
+        sections["Judgment at a Glance"]
+        if "Judgment at a Glance" in sections
+        else sections.get("Comprehensive Legal Summary", _EMPTY)
     )
     legal_raw = legal_sec.get("content", "")
-    timeline_raw = sections.get("Chronological Event Timeline", {}).get("content", "")
+    timeline_raw = sections.get("Chronological Event Timeline", _EMPTY).get(
+        "content", ""
+    )
 
     # Fallback: extract metadata from content when table is empty
     if not metadata:
         metadata = fallback_metadata_from_content(legal_raw, timeline_raw)
 
     # Parse witnesses table
-    witnesses_content = sections.get("Principal Witnesses & Ex.PW Extraction", {}).get(
-        "content", ""
-    )
-    if not witnesses_content:
-        witnesses_content = sections.get("Witnesses Extracted", {}).get("content", "")
-    if not witnesses_content:
-        witnesses_content = sections.get("Principal Witnesses", {}).get("content", "")
+    for title in _WITNESS_SECTIONS:
+        witnesses_content = sections.get(title, _EMPTY).get("content", "")
+        if witnesses_content:
+            break
 
     witnesses = parse_markdown_table(witnesses_content)
 
     # Legal summary (split numbered items for tabbed display)
-    legal_items = []
-    if legal_raw:
-        pattern = r"(?:^|\n)(?:#{1,6}\s*)?(?:\*\*)?(\d+\.\s+(?:\*\*)?[^\n*:]+)(?:\*\*)?:?\s*(?=\n|$)"
-        parts = re.split(pattern, legal_raw)
-
-        current_title = ""
-        preamble = parts[0].strip() if parts else ""
-        if preamble and not re.search(r"^\s*(?:#{1,6}\s*)?(?:\*\*)?\d+\.\s+", parts[0]):
-            legal_items.append({"title": "Overview", "content": preamble})
-
-        for i in range(1, len(parts), 2):
-            if i < len(parts):
-                current_title = parts[i].strip()
-                current_title = re.sub(r"^[\*\#]+|[\*\#]+$", "", current_title).strip()
-                current_title = re.sub(r"^\d+\.\s*", "", current_title).strip()
-                current_title = re.sub(r"^[\*\#]+|[\*\#]+$", "", current_title).strip()
-
-            content = parts[i + 1].strip() if i + 1 < len(parts) else ""
-
-            if current_title:
-                legal_items.append({"title": current_title, "content": content})
-
-        if not legal_items:
-            legal_items.append({"title": "Summary", "content": legal_raw})
+    legal_items = _parse_legal_items(legal_raw)
 
     # Taxonomy
-    taxonomy_content = sections.get("Taxonomy & Classification", {}).get("content", "")
+    taxonomy_content = sections.get("Taxonomy & Classification", _EMPTY).get(
+        "content", ""
+    )
     taxonomy_items = []
     if taxonomy_content:
         taxonomy_items.append({"label": "", "value": taxonomy_content})
 
     # Timeline
-    timeline_content = sections.get("Chronological Event Timeline", {}).get(
-        "content", ""
-    )
     timeline_items = []
-    if timeline_content:
+    if timeline_raw:
         current_label = ""
         current_detail = []
-        for line in timeline_content.strip().split("\n"):
+        for line in timeline_raw.strip().split("\n"):
             original_line = line
             clean_line = line.strip()
             if (
@@ -1288,7 +1574,7 @@ def load_analysis_detail(slug: str) -> dict | None:
                             "detail": "\n".join(current_detail).strip(),
                         }
                     )
-                bold_match = re.match(r"-\s+\*\*([^*]+)\*\*:\s*(.*)", original_line)
+                bold_match = _TIMELINE_BULLET_BOLD_RE.match(original_line)
                 if bold_match:
                     current_label = bold_match.group(1).strip()
                     detail_part = bold_match.group(2).strip()
@@ -1305,126 +1591,12 @@ def load_analysis_detail(slug: str) -> dict | None:
             )
 
     # Investigation Quality Audit
-    audit_section = sections.get("Investigation Quality Audit", {})
+    audit_section = sections.get("Investigation Quality Audit", _EMPTY)
     audit_content = audit_section.get("content", "")
     severity_score = audit_section.get("severity_score", 0)
     score_justification = audit_section.get("score_justification", "")
 
-    # Always try to extract the OVERALL severity score from content body
-    # because the top-level key can sometimes be a department sub-score
-    if audit_content:
-        # First, try to find the overall score (after "Overall Lapse Severity Score" heading)
-        overall_match = re.search(
-            r"Overall Lapse Severity Score.*?\n\s*\*\*Score:\s*(\d+)",
-            audit_content,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if overall_match:
-            severity_score = int(overall_match.group(1))
-        else:
-            # Try "Lapse Severity Score: N" pattern (always overrides top-level)
-            lapse_match = re.search(
-                r"Lapse Severity Score:\s*(?:\*\*)?(\d+)",
-                audit_content,
-                re.IGNORECASE,
-            )
-            if lapse_match:
-                severity_score = int(lapse_match.group(1))
-            elif not severity_score:
-                # Fallback: find last "Score: N" line (the overall is usually at the end)
-                all_scores = re.findall(
-                    r"(?:^|\n)[^\n]*?Score:\s*(?:\*\*)?(\d+)",
-                    audit_content,
-                    re.IGNORECASE,
-                )
-                if all_scores:
-                    severity_score = int(all_scores[-1])
-
-    # Parse audit into sub-sections
-    audit_subsections = []
-    if audit_content:
-        current_heading = ""
-        current_items = []
-        for line in audit_content.strip().split("\n"):
-            original_line = line
-            line = line.strip()
-            if not line or line == "---":
-                continue
-
-            # Skip score line so it doesn't become a header
-            if (
-                re.search(r"Lapse Severity Score", line, re.IGNORECASE)
-                or re.search(r"^\s*(?:\*\*)?Score:", line, re.IGNORECASE)
-                or "Observations/Lapses" in line
-            ):
-                continue
-
-            # Match either `### Heading` or `## **1. Lapses**` or `**Heading**: `
-            heading_match = re.match(r"^#{2,4}\s+(?:\*\*)?(.*?)(?:\*\*)?:?\s*$", line)
-            alt_heading_match = re.match(r"^\*\*([^*]+)\*\*:?\s*$", line)
-
-            if alt_heading_match and (
-                "Score:" in line
-                or len(line) > 60
-                or "Observations" in line
-                or "Rationale" in line
-            ):
-                alt_heading_match = None
-
-            if heading_match or alt_heading_match:
-                if current_heading:
-                    audit_subsections.append(
-                        {"heading": current_heading, "items": current_items}
-                    )
-                if heading_match:
-                    current_heading = heading_match.group(1).strip().rstrip(":")
-                else:
-                    current_heading = alt_heading_match.group(1).strip().rstrip(":")
-                current_heading = re.sub(r"^\*\*|\*\*$", "", current_heading).strip()
-                current_items = []
-            else:
-                bullet_bold_match = re.match(
-                    r"^(?:-|\*|\d+\.)\s+\*\*([^*]+)\*\*:?\s*(.*)", line
-                )
-                if bullet_bold_match:
-                    current_items.append(
-                        {
-                            "title": bullet_bold_match.group(1).strip(),
-                            "detail": bullet_bold_match.group(2).strip(),
-                        }
-                    )
-                else:
-                    top_level_match = re.match(r"^(?:\d+\.)\s+(.*)", line)
-                    if (
-                        top_level_match
-                        and not original_line.startswith(" ")
-                        and not original_line.startswith("\t")
-                    ):
-                        current_items.append(
-                            {"title": "", "detail": top_level_match.group(1).strip()}
-                        )
-                    else:
-                        if current_items:
-                            if current_items[-1]["detail"]:
-                                current_items[-1]["detail"] += "\n" + line
-                            else:
-                                current_items[-1]["detail"] = line
-                        else:
-                            current_items.append({"title": "", "detail": line})
-
-        if current_heading:
-            audit_subsections.append(
-                {"heading": current_heading, "items": current_items}
-            )
-
-        # Fallback: if no structured sub-sections are found, just use the remaining text
-        if not audit_subsections and audit_content.strip():
-            audit_subsections.append(
-                {
-                    "heading": "Audit Summary",
-                    "items": [{"title": "", "detail": audit_content.strip()}],
-                }
-            )
+    severity_score, audit_subsections = _parse_audit(audit_content, severity_score)
 
     outcome = extract_outcome_from_filename(os.path.basename(fpath), legal_raw)
 
@@ -1445,22 +1617,56 @@ def load_analysis_detail(slug: str) -> dict | None:
     }
 
 
+# Analysis pages only change with their source files (or a restart, which may
+# bring new templates), so browsers can revalidate them with If-None-Match
+_ETAG_BOOT = secrets.token_hex(4)
+_ANALYSIS_CACHE_HEADERS = {"Cache-Control": "private, max-age=60"}
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """True when the request's If-None-Match already names etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
 @app.get("/analyses", response_class=HTMLResponse)
 async def read_analyses(request: Request):
-    data = load_analysis_list()
-    return templates.TemplateResponse(
-        "analysis_list.html", {"request": request, **data}
-    )
+    # Tagged with the per-file stamps the list is keyed on, taken before
+    # loading, so a page built from newer files can only carry an older tag
+    # (and be refetched), never the reverse
+    key = await asyncio.to_thread(_analysis_files_key)
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+    etag = f'"{_ETAG_BOOT}-{digest}"'
+    headers = {"ETag": etag, **_ANALYSIS_CACHE_HEADERS}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    data = await asyncio.to_thread(load_analysis_list, key)
+    response = render("analysis_list.html", request, **data)
+    response.headers.update(headers)
+    return response
 
 
 @app.get("/analysis/{slug}", response_class=HTMLResponse)
 async def read_analysis_detail(request: Request, slug: str):
-    detail = load_analysis_detail(slug)
+    fpath = _analysis_detail_path(slug)
+    try:
+        mtime_ns = os.stat(fpath).st_mtime_ns
+    except OSError:
+        return HTMLResponse(content="Analysis not found", status_code=404)
+    etag = f'"{_ETAG_BOOT}-{mtime_ns}"'
+    headers = {"ETag": etag, **_ANALYSIS_CACHE_HEADERS}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    detail = await asyncio.to_thread(_load_analysis_detail, slug, fpath, mtime_ns)
     if not detail:
         return HTMLResponse(content="Analysis not found", status_code=404)
-    return templates.TemplateResponse(
-        "analysis_detail.html", {"request": request, **detail}
-    )
+    response = render("analysis_detail.html", request, **detail)
+    response.headers.update(headers)
+    return response
 
 
 if __name__ == "__main__":
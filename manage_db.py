@@ -8,6 +8,12 @@ import textwrap
 
 DB_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cases.db")
 
+# Statements reused by every command, so sqlite3's statement cache keeps
+# each one prepared after its first run
+_SELECT_ROW_SQL = "SELECT * FROM cases WHERE id = ?"
+_DELETE_ROW_SQL = "DELETE FROM cases WHERE id = ?"
+_STATS_SQL = "SELECT COUNT(*), MIN(id), MAX(id) FROM cases"
+
 
 def get_connection():
     if not os.path.exists(DB_NAME):
@@ -15,12 +21,13 @@ def get_connection():
         sys.exit(1)
     conn = sqlite3.connect(DB_NAME)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA cache_size=-20000")
     return conn
 
 
 def preview_row(conn, row_id):
     """Display all columns for a given row ID."""
-    row = conn.execute("SELECT * FROM cases WHERE id = ?", (row_id,)).fetchone()
+    row = conn.execute(_SELECT_ROW_SQL, (row_id,)).fetchone()
     if not row:
         print(f"\n  No record found with id = {row_id}")
         return None
@@ -51,7 +58,7 @@ def delete_row(conn, row_id):
 
     confirm = input(f"\n  Delete this record (id={row_id})? [y/N]: ").strip().lower()
     if confirm == "y":
-        conn.execute("DELETE FROM cases WHERE id = ?", (row_id,))
+        conn.execute(_DELETE_ROW_SQL, (row_id,))
         conn.commit()
         print(f"  ✓ Record {row_id} deleted.")
     else:
@@ -60,11 +67,11 @@ def delete_row(conn, row_id):
 
 def show_stats(conn):
     """Show basic DB stats."""
-    total = conn.execute("SELECT COUNT(*) FROM cases").fetchone()[0]
+    # Count and id range in one pass over the table
+    total, min_id, max_id = conn.execute(_STATS_SQL).fetchone()
     print(f"\n  Total records: {total}")
     print(f"  ID range: ", end="")
-    r = conn.execute("SELECT MIN(id), MAX(id) FROM cases").fetchone()
-    print(f"{r[0]} - {r[1]}")
+    print(f"{min_id} - {max_id}")
 
 
 def main():
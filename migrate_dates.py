@@ -1,4 +1,3 @@
-import sqlite3
 import os
 import sys
 from datetime import datetime
@@ -7,12 +6,12 @@ import re
 # Add app to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database import DB_NAME, parse_date
+from app.database import DB_NAME, get_db_connection, parse_date
 
 def migrate():
     print(f"Migrating dates in {DB_NAME}...")
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
+    # bulk: WAL + synchronous=NORMAL for the write phase
+    conn = get_db_connection(bulk=True)
     c = conn.cursor()
     
     # helper for verbose since parse_date in database.py handles it now
@@ -21,7 +20,8 @@ def migrate():
     
     cases = c.execute("SELECT id, date, filing_date FROM cases").fetchall()
     
-    updated = 0
+    updates = []
+    clears = []
     for case in cases:
         date_str = case['date']
         current_filing = case['filing_date']
@@ -35,15 +35,17 @@ def migrate():
                 # Update if different
                 if str(new_date) != str(current_filing):
                     print(f"Updating ID {case['id']}: {date_str} -> {new_date}")
-                    c.execute("UPDATE cases SET filing_date = ? WHERE id = ?", (new_date, case['id']))
-                    updated += 1
+                    updates.append((new_date, case['id']))
             else:
                 # If parse_date returns None (e.g. invalid future date), but we have a filing_date, clear it
                 if current_filing:
                     print(f"Clearing invalid date for ID {case['id']}: {date_str} (was {current_filing})")
-                    c.execute("UPDATE cases SET filing_date = NULL WHERE id = ?", (case['id'],))
-                    updated += 1
-                
+                    clears.append((case['id'],))
+
+    # One prepared statement per kind of change, all in a single transaction
+    c.executemany("UPDATE cases SET filing_date = ? WHERE id = ?", updates)
+    c.executemany("UPDATE cases SET filing_date = NULL WHERE id = ?", clears)
+    updated = len(updates) + len(clears)
     conn.commit()
     conn.close()
     print(f"Migration complete. Updated {updated} rows.")
@@ -1,20 +1,28 @@
-import sqlite3
 import os
 import sys
 
 # Add app to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database import DB_NAME, normalize_district
+from app.database import DB_NAME, get_db_connection, normalize_district
+
+# Pending updates are flushed every BATCH_SIZE rows to bound memory
+BATCH_SIZE = 5000
+UPDATE_SQL = "UPDATE cases SET district = ? WHERE id = ?"
 
 def migrate_districts():
     print(f"Migrating districts in {DB_NAME}...")
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
+    # bulk: WAL + synchronous=NORMAL for the write phase
+    conn = get_db_connection(bulk=True)
     c = conn.cursor()
+    # Separate cursor for writes so the streaming SELECT stays open
+    writer = conn.cursor()
     
-    cases = c.execute("SELECT id, district FROM cases").fetchall()
+    # Iterate rows lazily in rowid order; the rowid walk is unaffected by
+    # rewriting the (indexed) district column underneath it
+    cases = c.execute("SELECT id, district FROM cases ORDER BY id")
     
+    updates = []
     updated = 0
     for case in cases:
         old_dist = case['district']
@@ -24,9 +32,15 @@ def migrate_districts():
         
         if old_dist != new_dist:
             print(f"Updating ID {case['id']}: '{old_dist}' -> '{new_dist}'")
-            c.execute("UPDATE cases SET district = ? WHERE id = ?", (new_dist, case['id']))
-            updated += 1
-                
+            updates.append((new_dist, case['id']))
+            if len(updates) >= BATCH_SIZE:
+                writer.executemany(UPDATE_SQL, updates)
+                updated += len(updates)
+                updates.clear()
+
+    # Remaining changes; everything commits as a single transaction
+    writer.executemany(UPDATE_SQL, updates)
+    updated += len(updates)
     conn.commit()
     conn.close()
     print(f"District migration complete. Updated {updated} rows.")
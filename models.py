@@ -1,8 +1,21 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
+from functools import cached_property
 
+# Placeholder values that mean no real date / sentence was recorded
+_INVALID_DATE_MARKERS = (
+    "not specified",
+    "not mentioned",
+    "unknown",
+    "none",
+    "not provided",
+)
+_INVALID_SENTENCE_MARKERS = ("not specified", "not mentioned", "unknown", "none")
 
+
+# Rows are read-only once loaded, so the derived properties are computed
+# once per instance (templates read verdict several times per row)
 class Case(BaseModel):
     accused: Optional[str] = ""
     complaininat: Optional[str] = Field(None, alias="complaintant")
@@ -19,64 +32,41 @@ class Case(BaseModel):
     filing_date: Optional[datetime] = None
     summary: Optional[str] = None
 
-    @validator("complaininat", pre=True, always=True)
-    def check_aliases(cls, v, values):
-        return v
-
-    @validator("complaininat", pre=True)
-    def handle_typo(cls, v, values):
-        return v
-
     class Config:
         populate_by_name = True
 
-    @property
+    def _has_date(self) -> bool:
+        """True when a real judgment date (not a placeholder) is recorded."""
+        lower_date = (self.date or "").lower().strip()
+        return bool(lower_date) and not any(
+            d in lower_date for d in _INVALID_DATE_MARKERS
+        )
+
+    def _valid_sentence(self) -> str:
+        """Lowercased sentence_issued, or "" when blank or a placeholder."""
+        lower_sentence = (self.sentence_issued or "").lower()
+        if any(m in lower_sentence for m in _INVALID_SENTENCE_MARKERS):
+            return ""
+        return lower_sentence
+
+    @cached_property
     def is_active(self) -> bool:
         # A case is active ONLY if:
         # 1. No sentence/verdict is issued
         # 2. AND No judgment date is recorded
         # If a date is present, it's a closed/judged case, even if we don't know the exact verdict.
+        # That is exactly verdict's "Pending" branch, so reuse the cached verdict.
+        return self.verdict == "Pending"
 
-        lower_date = (self.date or "").lower().strip()
-        invalid_dates = [
-            "not specified",
-            "not mentioned",
-            "unknown",
-            "none",
-            "not provided",
-        ]
-        has_date = bool(lower_date and not any(d in lower_date for d in invalid_dates))
-
-        # Check explicit sentence/verdict field
-        lower_sentence = (self.sentence_issued or "").lower()
-        invalid_markers = ["not specified", "not mentioned", "unknown", "none"]
-        has_valid_sentence = lower_sentence and not any(
-            m in lower_sentence for m in invalid_markers
-        )
-
-        if has_date:
-            return False
-
-        if has_valid_sentence:
-            return False
-
-        return True
-
-    @property
+    @cached_property
     def verdict(self) -> str:
-        if self.is_active:
+        # Check explicit sentence/verdict field first; computed once and
+        # shared with the is_active test
+        lower_sentence = self._valid_sentence()
+        if not lower_sentence and not self._has_date():
             return "Pending"
 
-        # Check explicit sentence/verdict field first
-        lower_sentence = (self.sentence_issued or "").lower()
-
-        # known "Not specified" variations
-        invalid_markers = ["not specified", "not mentioned", "unknown", "none"]
-        is_valid_sentence = lower_sentence and not any(
-            m in lower_sentence for m in invalid_markers
-        )
-
-        if is_valid_sentence:
+        if lower_sentence:
             if "acquitte" in lower_sentence or "not guilty" in lower_sentence:
                 return "Acquittal"
             if "convict" in lower_sentence or "guilty" in lower_sentence:
@@ -105,7 +95,7 @@ class Case(BaseModel):
         # If it's closed (has date) but we couldn't determine Conviction/Acquittal
         return "Decided"
 
-    @property
+    @cached_property
     def formatted_date(self) -> str:
         if self.filing_date:
             return self.filing_date.strftime("%d %b %Y")  # 09 Oct 2025
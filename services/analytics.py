@@ -1,56 +1,91 @@
+import functools
 from typing import List, Dict, Any, Optional
+
+import cachetools.func
+
 # No longer using Counter, defaultdict, or datetime here
 
 
 try:
-    from app.database import get_db_connection
+    from app.database import get_read_connection
     from app.models import Case
 except ImportError:
-    from database import get_db_connection
+    from database import get_read_connection
     from models import Case
 
-# Centralized SQL logic for verdict and status to match Case model properties
-VERDICT_SQL = """
-CASE 
-    WHEN (date IS NULL OR date = '' OR lower(date) IN ('not specified', 'not mentioned', 'unknown', 'none', 'not provided'))
-         AND (sentence_issued IS NULL OR sentence_issued = '' OR lower(sentence_issued) IN ('not specified', 'not mentioned', 'unknown', 'none'))
-    THEN 'Pending'
-    WHEN (lower(sentence_issued) LIKE '%acquitte%' OR lower(sentence_issued) LIKE '%not guilty%') THEN 'Acquittal'
-    WHEN (lower(sentence_issued) LIKE '%convict%' OR lower(sentence_issued) LIKE '%guilty%') THEN 'Conviction'
-    WHEN lower(sentence_issued) LIKE '%dismiss%' THEN 'Dismissed'
-    WHEN (lower(summary) LIKE '%acquittal%' OR lower(summary) LIKE '%acquitted%' OR lower(summary) LIKE '%not guilty%') THEN 'Acquittal'
-    WHEN (lower(summary) LIKE '%conviction%' OR lower(summary) LIKE '%convicted%' OR lower(summary) LIKE '%guilty%') THEN 'Conviction'
-    WHEN lower(summary) LIKE '%dismiss%' THEN 'Dismissed'
-    ELSE 'Decided'
-END
-"""
-
-IS_ACTIVE_SQL = """
-CASE 
-    WHEN (date IS NULL OR date = '' OR lower(date) IN ('not specified', 'not mentioned', 'unknown', 'none', 'not provided'))
-         AND (sentence_issued IS NULL OR sentence_issued = '' OR lower(sentence_issued) IN ('not specified', 'not mentioned', 'unknown', 'none'))
-    THEN 1
-    ELSE 0
-END
-"""
+
+def _query_rows(conn, sql: str, params=()) -> tuple:
+    """Run sql on a plain-tuple cursor, returning (column names, rows).
+
+    Tuples skip sqlite3.Row's per-column lookups when the rows are only
+    hydrated into Case objects.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    rows = cursor.execute(sql, params).fetchall()
+    return [d[0] for d in cursor.description], rows
+
+
+def _scalar(conn, sql: str, params=()):
+    """First column of the first row of sql, read without a sqlite3.Row."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor.execute(sql, params).fetchone()[0]
+
+
+def _rows_to_cases(keys: list, rows: list) -> List[Case]:
+    """Build Cases from _query_rows() output.
+
+    Validation stays on: pydantic v2 validates in its compiled core, which
+    is faster than model_construct() and also parses filing_date.
+    """
+    validate = Case.model_validate
+    return [validate(dict(zip(keys, row))) for row in rows]
 
 
 def load_cases() -> List[Case]:
     """Deprecated: Loads all cases into memory. Use get_paginated_records for UI."""
-    conn = get_db_connection()
-    cases = conn.execute("SELECT * FROM cases").fetchall()
-    conn.close()
-    return [Case(**dict(row)) for row in cases]
+    conn = get_read_connection()
+    return _rows_to_cases(*_query_rows(conn, "SELECT * FROM cases"))
 
 
 def get_case_by_corno(corno: str) -> Optional[Case]:
     """Fetch a single case by its unique COR number."""
-    conn = get_db_connection()
-    row = conn.execute("SELECT * FROM cases WHERE corno = ?", (corno,)).fetchone()
-    conn.close()
-    if row:
-        return Case(**dict(row))
-    return None
+    conn = get_read_connection()
+    cases = _rows_to_cases(
+        *_query_rows(conn, "SELECT * FROM cases WHERE corno = ? LIMIT 1", (corno,))
+    )
+    return cases[0] if cases else None
+
+
+# get_paginated_records filter clauses, in argument order
+_RECORD_FILTERS = (
+    " AND judge = ?",
+    " AND district = ?",
+    " AND court = ?",
+    " AND (accused LIKE ? OR corno LIKE ? OR summary LIKE ?)",
+    " AND filing_date >= ?",
+    " AND filing_date <= ?",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _records_sql(flags: tuple) -> tuple:
+    """(SELECT *, SELECT COUNT(*)) for the filters switched on in flags."""
+    where = " FROM cases WHERE 1=1" + "".join(
+        clause for clause, on in zip(_RECORD_FILTERS, flags) if on
+    )
+    return "SELECT *" + where, "SELECT COUNT(*)" + where
+
+
+@cachetools.func.ttl_cache(maxsize=256, ttl=300)
+def _cached_count(conn, data_version: int, sql: str, params: tuple) -> int:
+    """COUNT(*) for sql, reused while conn's data_version stays the same.
+
+    data_version moves whenever another connection commits, so paging
+    through the same filters counts once until the data changes.
+    """
+    return _scalar(conn, sql, params)
 
 
 def get_paginated_records(
@@ -62,45 +97,60 @@ def get_paginated_records(
     search: str = None,
     start_date: str = None,
     end_date: str = None,
+    cursor_date: str = None,
+    cursor_id: int = None,
 ) -> Dict[str, Any]:
-    """Fetch a slice of cases based on filters and pagination."""
-    conn = get_db_connection()
-    query = "SELECT * FROM cases WHERE 1=1"
-    params = []
-
-    if judge:
-        query += " AND judge = ?"
-        params.append(judge)
-    if district:
-        query += " AND district = ?"
-        params.append(district)
-    if court:
-        query += " AND court = ?"
-        params.append(court)
+    """Fetch a slice of cases based on filters and pagination.
+
+    Passing the previous page's next_cursor (cursor_date, cursor_id) seeks
+    the (filing_date DESC, id DESC) index instead of skipping OFFSET rows;
+    page then only labels the slice.
+    """
+    conn = get_read_connection()
+    filters = (judge, district, court, search, start_date, end_date)
+    query, count_query = _records_sql(tuple(map(bool, filters)))
+    params = [v for v in (judge, district, court) if v]
     if search:
-        query += " AND (accused LIKE ? OR corno LIKE ? OR summary LIKE ?)"
-        search_param = f"%{search}%"
-        params.extend([search_param, search_param, search_param])
-    if start_date:
-        query += " AND filing_date >= ?"
-        params.append(start_date)
-    if end_date:
-        query += " AND filing_date <= ?"
-        params.append(end_date)
+        params += [f"%{search}%"] * 3
+    params += [v for v in (start_date, end_date) if v]
 
     # Get total count for pagination UI
-    count_query = query.replace("SELECT *", "SELECT COUNT(*)")
-    total_count = conn.execute(count_query, params).fetchone()[0]
+    data_version = _scalar(conn, "PRAGMA data_version")
+    total_count = _cached_count(conn, data_version, count_query, tuple(params))
 
     # Add sorting and pagination
-    query += " ORDER BY filing_date DESC, id DESC LIMIT ? OFFSET ?"
-    offset = (page - 1) * page_size
-    params.extend([page_size, offset])
+    order = " ORDER BY filing_date DESC, id DESC LIMIT ?"
+    if cursor_id is None:
+        offset = (page - 1) * page_size
+        keys, rows = _query_rows(
+            conn, query + order + " OFFSET ?", params + [page_size, offset]
+        )
+    elif cursor_date is None:
+        keys, rows = _query_rows(
+            conn,
+            query + " AND filing_date IS NULL AND id < ?" + order,
+            params + [cursor_id, page_size],
+        )
+    else:
+        keys, rows = _query_rows(
+            conn,
+            query + " AND (filing_date, id) < (?, ?)" + order,
+            params + [cursor_date, cursor_id, page_size],
+        )
+        # Undated rows sort after every dated one
+        if len(rows) < page_size:
+            rows += _query_rows(
+                conn,
+                query + " AND filing_date IS NULL" + order,
+                params + [page_size - len(rows)],
+            )[1]
 
-    rows = conn.execute(query, params).fetchall()
-    conn.close()
+    next_cursor = None
+    if len(rows) == page_size:
+        last = dict(zip(keys, rows[-1]))
+        next_cursor = {"date": last["filing_date"], "id": last["id"]}
 
-    cases = [Case(**dict(row)) for row in rows]
+    cases = _rows_to_cases(keys, rows)
 
     return {
         "cases": cases,
@@ -108,32 +158,34 @@ def get_paginated_records(
         "page": page,
         "page_size": page_size,
         "total_pages": (total_count + page_size - 1) // page_size,
+        "next_cursor": next_cursor,
     }
 
 
 def get_global_stats(analysis_type: str = "All Outcomes") -> Dict[str, Any]:
-    conn = get_db_connection()
+    conn = get_read_connection()
 
     # Build base where clause
     where_clause = "1=1"
     if analysis_type == "Convictions Only":
-        where_clause = f"{VERDICT_SQL} = 'Conviction'"
+        where_clause = "verdict = 'Conviction'"
     elif analysis_type == "Acquittals Only":
-        where_clause = f"{VERDICT_SQL} = 'Acquittal'"
+        where_clause = "verdict = 'Acquittal'"
 
-    # Counts
-    active_cases = conn.execute(
-        f"SELECT COUNT(*) FROM cases WHERE {IS_ACTIVE_SQL} = 1 AND {where_clause}"
-    ).fetchone()[0]
-    total_cases = conn.execute(
-        f"SELECT COUNT(*) FROM cases WHERE {where_clause}"
-    ).fetchone()[0]
-
-    # Verdicts
-    verdict_rows = conn.execute(
-        f"SELECT {VERDICT_SQL} as v, COUNT(*) as c FROM cases WHERE {where_clause} GROUP BY v"
+    # One scan of the (district, verdict) index. The verdict totals and the
+    # district breakdown are both summed from these groups, and the counts
+    # follow from them, as is_active is 'Pending'.
+    group_rows = conn.execute(
+        f"SELECT district, verdict as v, COUNT(*) as c FROM cases WHERE {where_clause} GROUP BY district, v"
     ).fetchall()
-    verdict_counts = {row["v"]: row["c"] for row in verdict_rows}
+    verdict_counts = {}
+    districts = {}
+    for row in group_rows:
+        v, c = row["v"], row["c"]
+        verdict_counts[v] = verdict_counts.get(v, 0) + c
+        districts.setdefault(row["district"], {})[v] = c
+    active_cases = verdict_counts.get("Pending", 0)
+    total_cases = sum(verdict_counts.values())
 
     decided_pool = sum(count for v, count in verdict_counts.items() if v != "Pending")
     total_decided = decided_pool or 1
@@ -142,31 +194,22 @@ def get_global_stats(analysis_type: str = "All Outcomes") -> Dict[str, Any]:
     acquittal_rate = int((verdict_counts.get("Acquittal", 0) / total_decided) * 100)
 
     # District Volumes
-    # We also want the performance status per district
-    district_rows = conn.execute(
-        f"""
-        SELECT 
-            district, 
-            COUNT(*) as vol,
-            AVG({IS_ACTIVE_SQL}) as active_ratio,
-            SUM(CASE WHEN ({VERDICT_SQL}) = 'Conviction' THEN 1 ELSE 0 END) as convictions,
-            SUM(CASE WHEN ({VERDICT_SQL}) = 'Acquittal' THEN 1 ELSE 0 END) as acquittals,
-            SUM(CASE WHEN ({VERDICT_SQL}) = 'Pending' THEN 1 ELSE 0 END) as pending,
-            SUM(CASE WHEN ({VERDICT_SQL}) IN ('Dismissed', 'Decided') THEN 1 ELSE 0 END) as other
-        FROM cases 
-        WHERE {where_clause} 
-        GROUP BY district
-        ORDER BY vol DESC
-    """
-    ).fetchall()
+    # We also want the performance status per district; busiest first,
+    # ties by name
+    ranked = sorted(
+        (
+            (sum(d_counts.values()), name, d_counts)
+            for name, d_counts in districts.items()
+        ),
+        key=lambda t: (-t[0], t[1] is not None, t[1] or ""),
+    )
 
     district_volumes = []
     max_vol = 0
-    for row in district_rows:
-        vol = row["vol"]
+    for vol, district, d_counts in ranked:
         if vol > max_vol:
             max_vol = vol
-        active_ratio = row["active_ratio"] or 0
+        active_ratio = d_counts.get("Pending", 0) / vol
         status = "neutral"
         if active_ratio > 0.5:
             status = "lagging"
@@ -175,24 +218,24 @@ def get_global_stats(analysis_type: str = "All Outcomes") -> Dict[str, Any]:
 
         district_volumes.append(
             {
-                "name": row["district"] or "Unknown",
-                "volume": row["vol"],
+                "name": district or "Unknown",
+                "volume": vol,
                 "status": status,
                 "active_ratio": int(active_ratio * 100),
-                "convictions": row["convictions"] or 0,
-                "acquittals": row["acquittals"] or 0,
-                "pending": row["pending"] or 0,
-                "other": row["other"] or 0,
+                "convictions": d_counts.get("Conviction", 0),
+                "acquittals": d_counts.get("Acquittal", 0),
+                "pending": d_counts.get("Pending", 0),
+                "other": d_counts.get("Dismissed", 0) + d_counts.get("Decided", 0),
             }
         )
 
     # Recent Activity
-    recent_rows = conn.execute(
-        f"SELECT * FROM cases WHERE {where_clause} ORDER BY filing_date DESC, id DESC LIMIT 10"
-    ).fetchall()
-    recent_verdicts = [Case(**dict(row)) for row in recent_rows]
-
-    conn.close()
+    recent_verdicts = _rows_to_cases(
+        *_query_rows(
+            conn,
+            f"SELECT * FROM cases WHERE {where_clause} ORDER BY filing_date DESC, id DESC LIMIT 10",
+        )
+    )
 
     return {
         "active_cases": active_cases,
@@ -216,80 +259,79 @@ def get_global_stats(analysis_type: str = "All Outcomes") -> Dict[str, Any]:
     }
 
 
-def get_district_stats(district_name: str) -> Dict[str, Any]:
-    conn = get_db_connection()
+def _sorted_groups(groups: dict) -> list:
+    """Group keys in SQLite's GROUP BY order: NULL first, then BINARY collation."""
+    return sorted(groups, key=lambda k: (k is not None, k or ""))
 
-    # Core Counts
-    counts = conn.execute(
-        f"SELECT COUNT(*) as total, SUM({IS_ACTIVE_SQL}) as active FROM cases WHERE district = ?",
-        (district_name,),
-    ).fetchone()
 
-    total = counts["total"] or 0
-    active = counts["active"] or 0
+def get_district_stats(district_name: str) -> Dict[str, Any]:
+    conn = get_read_connection()
 
-    # Verdicts for Success Rate
-    verdict_rows = conn.execute(
-        f"SELECT {VERDICT_SQL} as v, COUNT(*) as c FROM cases WHERE district = ? AND {IS_ACTIVE_SQL} = 0 GROUP BY v",
+    # One pass over the district: counts per (court, judge, verdict). Every
+    # breakdown below is summed from these groups; 'Pending' is exactly
+    # is_active = 1.
+    group_rows = conn.execute(
+        "SELECT court, judge, verdict as v, COUNT(*) as c FROM cases WHERE district = ? GROUP BY court, judge, v",
         (district_name,),
     ).fetchall()
-    v_counts = {row["v"]: row["c"] for row in verdict_rows}
+
+    total = active = 0
+    v_counts = {}
+    courts = {}
+    judges = {}
+    court_judge_counts = {}
+    for row in group_rows:
+        c = row["c"]
+        is_active = row["v"] == "Pending"
+        total += c
+        if is_active:
+            active += c
+        else:
+            # Verdicts for Success Rate (closed cases only)
+            v_counts[row["v"]] = v_counts.get(row["v"], 0) + c
+        for groups, key in ((courts, row["court"]), (judges, row["judge"])):
+            counts = groups.setdefault(key, [0, 0])
+            counts[0] += c
+            if is_active:
+                counts[1] += c
+        # Cases per judge within each court, for its presiding judge
+        court_judges = court_judge_counts.setdefault(row["court"], {})
+        court_judges[row["judge"]] = court_judges.get(row["judge"], 0) + c
+
     total_closed = sum(v_counts.values()) or 1
     success_rate = int((v_counts.get("Conviction", 0) / total_closed) * 100)
 
     # Court Data
-    court_rows = conn.execute(
-        f"SELECT court, COUNT(*) as total, SUM({IS_ACTIVE_SQL}) as active FROM cases WHERE district = ? GROUP BY court",
-        (district_name,),
-    ).fetchall()
-
     court_breakdown = []
-    for row in court_rows:
-        j_row = conn.execute(
-            "SELECT judge FROM cases WHERE court = ? LIMIT 1", (row["court"],)
-        ).fetchone()
-        clr_rate = (
-            int(((row["total"] - row["active"]) / row["total"]) * 100)
-            if row["total"] > 0
-            else 0
-        )
+    for court in _sorted_groups(courts):
+        c_total, c_active = courts[court]
+        # Presiding judge: the one with the most cases in this court here
+        court_judges = court_judge_counts[court]
+        presiding_judge = max(court_judges, key=court_judges.get)
+        clr_rate = int(((c_total - c_active) / c_total) * 100) if c_total > 0 else 0
         court_breakdown.append(
             {
-                "name": row["court"] or "Unknown",
-                "total": row["total"],
-                "active": row["active"],
-                "presiding_judge": j_row["judge"] if j_row else "N/A",
+                "name": court or "Unknown",
+                "total": c_total,
+                "active": c_active,
+                "presiding_judge": presiding_judge or "N/A",
                 "clearance": clr_rate,
                 "status": "Optimal" if clr_rate > 80 else "Lagging",
             }
         )
 
-    # Judges count
-    total_judges = conn.execute(
-        "SELECT COUNT(DISTINCT judge) FROM cases WHERE district = ?",
-        (district_name,),
-    ).fetchone()[0]
-
-    # Courts count
-    total_courts = conn.execute(
-        "SELECT COUNT(DISTINCT court) FROM cases WHERE district = ?",
-        (district_name,),
-    ).fetchone()[0]
+    # Judges / courts count (COUNT(DISTINCT ...) skips NULL)
+    total_judges = sum(1 for judge in judges if judge is not None)
+    total_courts = sum(1 for court in courts if court is not None)
 
     # Judge Data
-    judge_rows = conn.execute(
-        f"SELECT judge, COUNT(*) as total, SUM({IS_ACTIVE_SQL}) as active FROM cases WHERE district = ? GROUP BY judge",
-        (district_name,),
-    ).fetchall()
-
     judge_breakdown = []
-    for row in judge_rows:
-        j_total = row["total"]
-        j_active = row["active"]
+    for judge in _sorted_groups(judges):
+        j_total, j_active = judges[judge]
         clr_rate = int(((j_total - j_active) / j_total) * 100) if j_total > 0 else 0
         judge_breakdown.append(
             {
-                "name": row["judge"] or "Unknown",
+                "name": judge or "Unknown",
                 "total": j_total,
                 "active": j_active,
                 "clearance": clr_rate,
@@ -298,13 +340,13 @@ def get_district_stats(district_name: str) -> Dict[str, Any]:
         )
 
     # Recent Cases
-    recent_rows = conn.execute(
-        "SELECT * FROM cases WHERE district = ? ORDER BY filing_date DESC, id DESC LIMIT 5",
-        (district_name,),
-    ).fetchall()
-    recent_cases = [Case(**dict(row)) for row in recent_rows]
-
-    conn.close()
+    recent_cases = _rows_to_cases(
+        *_query_rows(
+            conn,
+            "SELECT * FROM cases WHERE district = ? ORDER BY filing_date DESC, id DESC LIMIT 5",
+            (district_name,),
+        )
+    )
 
     return {
         "name": district_name,
@@ -320,31 +362,21 @@ def get_district_stats(district_name: str) -> Dict[str, Any]:
 
 
 def get_court_stats(court: str) -> Dict[str, Any]:
-    conn = get_db_connection()
+    conn = get_read_connection()
 
-    # Core Counts
-    counts = conn.execute(
-        f"SELECT COUNT(*) as total, SUM({IS_ACTIVE_SQL}) as active FROM cases WHERE court = ?",
-        (court,),
-    ).fetchone()
-
-    total = counts["total"] or 0
-    active = counts["active"] or 0
-
-    # Clearance Rate
-    closed = total - active
-    clearance_rate = int((closed / total) * 100) if total > 0 else 0
-
-    # Judge Data
+    # Judge Data; the court totals are summed from the same groups
     judge_rows = conn.execute(
-        f"SELECT judge, COUNT(*) as total, SUM({IS_ACTIVE_SQL}) as active FROM cases WHERE court = ? GROUP BY judge",
+        "SELECT judge, COUNT(*) as total, SUM(is_active) as active FROM cases WHERE court = ? GROUP BY judge",
         (court,),
     ).fetchall()
 
+    total = active = 0
     formatted_judges = []
     for row in judge_rows:
         j_total = row["total"]
         j_active = row["active"]
+        total += j_total
+        active += j_active
         retention = int((j_active / j_total) * 100) if j_total > 0 else 0
         formatted_judges.append(
             {
@@ -356,7 +388,9 @@ def get_court_stats(court: str) -> Dict[str, Any]:
             }
         )
 
-    conn.close()
+    # Clearance Rate
+    closed = total - active
+    clearance_rate = int((closed / total) * 100) if total > 0 else 0
 
     return {
         "active_cases": active,
@@ -369,11 +403,11 @@ def get_court_stats(court: str) -> Dict[str, Any]:
 
 
 def get_judge_stats(judge_name: str) -> Dict[str, Any]:
-    conn = get_db_connection()
+    conn = get_read_connection()
 
     # Core Counts
     counts = conn.execute(
-        f"SELECT COUNT(*) as total, SUM({IS_ACTIVE_SQL}) as active FROM cases WHERE judge = ?",
+        "SELECT COUNT(*) as total, SUM(is_active) as active FROM cases WHERE judge = ?",
         (judge_name,),
     ).fetchone()
 
@@ -391,19 +425,19 @@ def get_judge_stats(judge_name: str) -> Dict[str, Any]:
 
     # Verdict Distribution
     verdict_rows = conn.execute(
-        f"SELECT {VERDICT_SQL} as v, COUNT(*) as c FROM cases WHERE judge = ? GROUP BY v",
+        "SELECT verdict as v, COUNT(*) as c FROM cases WHERE judge = ? GROUP BY v",
         (judge_name,),
     ).fetchall()
     v_stats = {row["v"]: row["c"] for row in verdict_rows}
 
     # Recent cases
-    recent_rows = conn.execute(
-        "SELECT * FROM cases WHERE judge = ? ORDER BY filing_date DESC, id DESC LIMIT 10",
-        (judge_name,),
-    ).fetchall()
-    recent_cases = [Case(**dict(row)) for row in recent_rows]
-
-    conn.close()
+    recent_cases = _rows_to_cases(
+        *_query_rows(
+            conn,
+            "SELECT * FROM cases WHERE judge = ? ORDER BY filing_date DESC, id DESC LIMIT 10",
+            (judge_name,),
+        )
+    )
 
     return {
         "name": judge_name,